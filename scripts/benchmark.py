@@ -0,0 +1,212 @@
+# Benchmark the static and dynamic extraction engines on synthetic packages.
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from textwrap import dedent, indent
+from typing import Callable
+
+from griffe import Extensions, GriffeLoader, Module, Object
+
+from griffe_typingdoc import TypingDocExtension
+
+_header = """\
+from typing import Generator, Iterator, TypedDict
+from typing_extensions import Annotated, Doc, Unpack, deprecated
+"""
+
+
+def _function(name: str, *, prefix: str = "", method: bool = False) -> str:
+    self = "self, " if method else ""
+    code = dedent(f'''
+        def {name}(
+            {self}a: Annotated[int, Doc("Parameter a of {name}.")],
+            b: Annotated[str, Doc("""Parameter b of {name}.
+
+            It has a longer description.
+            """)] = "b",
+            c: int = 0,
+        ) -> Annotated[int, Doc("Returned by {name}."), deprecated("Deprecated since v1.")]:
+            """Summary of {name}."""
+    ''')
+    return indent(code, prefix)
+
+
+def _class(name: str, attributes: int, methods: int, *, prefix: str = "") -> str:
+    lines = [f"class {name}:", '    """Summary."""']
+    lines.extend(
+        f'    attr{index}: Annotated[int, Doc("Attribute {index} of {name}.")] = {index}' for index in range(attributes)
+    )
+    lines.extend(_function(f"method{index}", prefix="    ", method=True) for index in range(methods))
+    return indent("\n".join(lines), prefix)
+
+
+def _shape_modules(root: Path, size: int) -> None:
+    # Many small modules, each with a few functions and a small class.
+    for index in range(size):
+        functions = "\n".join(_function(f"function{number}") for number in range(3))
+        root.joinpath(f"module{index}.py").write_text(f"{_header}\n{functions}\n{_class('Class', 3, 2)}\n")
+
+
+def _shape_classes(root: Path, size: int) -> None:
+    # A few huge classes with hundreds of fields and methods.
+    classes = "\n\n".join(_class(f"Class{index}", attributes=size * 10, methods=size) for index in range(3))
+    root.joinpath("classes.py").write_text(f"{_header}\n{classes}\n")
+
+
+def _shape_nesting(root: Path, size: int) -> None:
+    # Deeply nested packages and classes.
+    package = root
+    for depth in range(size):
+        package = package / f"level{depth}"
+        package.mkdir()
+        nested = _class("Outer", 2, 1) + "\n" + _class("Inner", 2, 1, prefix="    ")
+        package.joinpath("__init__.py").write_text(f"{_header}\n{nested}\n{_function('function')}\n")
+
+
+def _shape_typeddicts(root: Path, size: int) -> None:
+    # Functions unpacking a few large, shared typed dicts.
+    options = "\n".join(
+        f"class Options{index}(TypedDict, total=False):\n"
+        + "\n".join(f'    option{field}: Annotated[int, Doc("Option {field}.")]' for field in range(50))
+        for index in range(3)
+    )
+    root.joinpath("options.py").write_text(f"{_header}\n{options}\n")
+    functions = "\n".join(
+        f'def function{index}(**kwargs: Unpack[Options{index % 3}]) -> None:\n    """Summary."""'
+        for index in range(size * 10)
+    )
+    root.joinpath("functions.py").write_text(
+        f"{_header}\nfrom package.options import Options0, Options1, Options2\n\n{functions}\n",
+    )
+
+
+def _shape_generators(root: Path, size: int) -> None:
+    # Generator-returning APIs documenting yielded, received and returned values.
+    functions = "\n".join(
+        dedent(f'''
+            def generator{index}() -> Generator[
+                tuple[Annotated[int, Doc("First yielded.")], Annotated[str, Doc("Second yielded.")]],
+                Annotated[int, Doc("Received.")],
+                Annotated[bool, Doc("Returned.")],
+            ]:
+                """Summary."""
+                yield 0, ""
+
+            def iterator{index}() -> Iterator[Annotated[int, Doc("Yielded.")]]:
+                """Summary."""
+                yield 0
+        ''')
+        for index in range(size * 10)
+    )
+    root.joinpath("generators.py").write_text(f"{_header}\n{functions}\n")
+
+
+_shapes: dict[str, Callable[[Path, int], None]] = {
+    "modules": _shape_modules,
+    "classes": _shape_classes,
+    "nesting": _shape_nesting,
+    "typeddicts": _shape_typeddicts,
+    "generators": _shape_generators,
+}
+
+
+def _count(obj: Object) -> int:
+    count = 0
+    for member in obj.members.values():
+        if member.is_alias:
+            continue
+        if member.is_module or member.is_class:
+            count += _count(member)  # type: ignore[arg-type]
+        elif member.is_function or member.is_attribute:
+            count += 1
+    return count
+
+
+def _load(search_path: Path, *, engine: str, extension: bool) -> Module:
+    extensions = Extensions(TypingDocExtension()) if extension else Extensions()
+    loader = GriffeLoader(extensions=extensions, search_paths=[search_path], force_inspection=engine == "dynamic")
+    package = loader.load("package")
+    # Forget imported modules so that the next dynamic load inspects them again.
+    for name in [name for name in sys.modules if name == "package" or name.startswith("package.")]:
+        del sys.modules[name]
+    return package  # type: ignore[return-value]
+
+
+def _measure(search_path: Path, *, engine: str, extension: bool, repeat: int) -> tuple[float, Module]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        package = _load(search_path, engine=engine, extension=extension)
+        timings.append(time.perf_counter() - start)
+    return min(timings), package
+
+
+def _benchmark(shape: str, size: int, engine: str, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        search_path = Path(tmpdir)
+        root = search_path / "package"
+        root.mkdir()
+        root.joinpath("__init__.py").write_text('"""Synthetic package."""\n')
+        _shapes[shape](root, size)
+        if engine == "dynamic":
+            sys.path.insert(0, tmpdir)
+        try:
+            baseline, _ = _measure(search_path, engine=engine, extension=False, repeat=repeat)
+            seconds, package = _measure(search_path, engine=engine, extension=True, repeat=repeat)
+            tracemalloc.start()
+            _load(search_path, engine=engine, extension=True)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            if engine == "dynamic":
+                sys.path.remove(tmpdir)
+    objects = _count(package)
+    return {
+        "shape": shape,
+        "size": size,
+        "engine": engine,
+        "objects": objects,
+        "seconds": seconds,
+        "baseline_seconds": baseline,
+        "extension_seconds": seconds - baseline,
+        "objects_per_second": objects / seconds if seconds else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the griffe-typingdoc extraction engines.")
+    parser.add_argument("-s", "--shape", action="append", choices=sorted(_shapes), help="Package shapes to generate.")
+    parser.add_argument("-n", "--size", type=int, default=20, help="Size factor of generated packages.")
+    parser.add_argument("-e", "--engine", action="append", choices=["static", "dynamic"], help="Engines to benchmark.")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of runs, the best one is reported.")
+    parser.add_argument("-o", "--output", type=Path, help="Write JSON results to this file instead of stdout.")
+    opts = parser.parse_args(args)
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": [
+            _benchmark(shape, opts.size, engine, opts.repeat)
+            for shape in opts.shape or sorted(_shapes)
+            for engine in opts.engine or ["static", "dynamic"]
+        ],
+    }
+    output = json.dumps(results, indent=2)
+    if opts.output:
+        opts.output.write_text(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,32 @@ Griffe extension for PEP 727 - Documentation Metadata in Typing.
 
 from __future__ import annotations
 
-from griffe_typingdoc._internal.extension import TypingDocExtension
+import sys
+from importlib import import_module
+from typing import Any
 
-__all__: list[str] = ["TypingDocExtension"]
+from griffe_typingdoc._internal.index import TypingDocIndex
+
+# The extension and the command-line interface depend on Griffe, which is only imported once they are accessed,
+# so that indexes can be read without it. Griffe finds extensions among the attributes of their module:
+# when Griffe is already imported, for example because it is loading the extension, they are imported right away.
+if "griffe" in sys.modules:
+    from griffe_typingdoc._internal.cli import get_parser, main
+    from griffe_typingdoc._internal.extension import TypingDocExtension
+
+_lazy_modules = {
+    "TypingDocExtension": "griffe_typingdoc._internal.extension",
+    "get_parser": "griffe_typingdoc._internal.cli",
+    "main": "griffe_typingdoc._internal.cli",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_modules:
+        value = getattr(import_module(_lazy_modules[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__: list[str] = ["TypingDocExtension", "TypingDocIndex", "get_parser", "main"]
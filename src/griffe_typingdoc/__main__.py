@@ -0,0 +1,13 @@
+"""Entry-point module, in case you use `python -m griffe_typingdoc`.
+
+Why does this file exist, and why `__main__`? For more info, read:
+
+- https://www.python.org/dev/peps/pep-0338/
+- https://docs.python.org/3/using/cmdline.html#cmdoption-m
+"""
+
+import sys
+
+from griffe_typingdoc._internal.cli import main
+
+sys.exit(main(sys.argv[1:]))
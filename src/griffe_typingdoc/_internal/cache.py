@@ -0,0 +1,153 @@
+# Caching utilities used by the extraction engines.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from griffe import json_decoder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from griffe import Module
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class _LRUCache(Generic[_K, _V]):
+    """A least-recently-used mapping with hit/miss counters."""
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        self.maxsize = maxsize
+        """Maximum number of entries (`None` for unbounded, `0` to disable caching)."""
+        self.hits = 0
+        """Number of successful lookups."""
+        self.misses = 0
+        """Number of failed lookups."""
+        self.evictions = 0
+        """Number of entries dropped because the cache was full."""
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        # Sections can be extracted from several threads at once.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: _K) -> _V | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: _K, value: _V) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int | None]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+    def _evict(self) -> None:
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+
+def _file_digest(filepath: Path) -> str | None:
+    try:
+        return hashlib.sha256(filepath.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _source_digest(module: Module) -> str | None:
+    filepath = module.filepath
+    return _file_digest(filepath) if isinstance(filepath, Path) else None
+
+
+class _DiskCache:
+    """A persistent cache of JSON data extracted from modules, keyed on their source and checked against their dependencies."""
+
+    def __init__(self, directory: str | Path, *, fingerprint: str = "") -> None:
+        self.directory = Path(directory)
+        """Directory in which entries are written."""
+        self.fingerprint = fingerprint
+        """Additional data identifying the configuration that produced the entries."""
+        self.hits = 0
+        """Number of modules loaded from the cache."""
+        self.misses = 0
+        """Number of modules not found in the cache."""
+        self.writes = 0
+        """Number of modules written to the cache."""
+
+    def _entry(self, module: Module) -> Path | None:
+        if (digest := _source_digest(module)) is None:
+            return None
+        key = hashlib.sha256(f"{module.filepath}\0{self.fingerprint}\0{digest}".encode())
+        return self.directory / f"{key.hexdigest()}.json"
+
+    def get(self, module: Module) -> dict[str, Any] | None:
+        if (entry := self._entry(module)) is None:
+            self.misses += 1
+            return None
+        try:
+            data = json.loads(entry.read_text(encoding="utf8"), object_hook=json_decoder)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # Sections can depend on other modules, for example through aliases or unpacked typed dicts:
+        # the entry is stale as soon as one of them changed.
+        if any(_file_digest(Path(filepath)) != digest for filepath, digest in data["dependencies"].items()):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data["objects"]
+
+    def set(self, module: Module, data: dict[str, Any], *, dependencies: Iterable[Module] = ()) -> None:
+        if (entry := self._entry(module)) is None:
+            return
+        digests = {}
+        for dependency in dependencies:
+            if dependency is not module:
+                if (digest := _source_digest(dependency)) is None:
+                    # Changes to this dependency could not be detected: do not cache the module.
+                    return
+                digests[str(dependency.filepath)] = digest
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent builds never read partial entries.
+        temporary = entry.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(
+            json.dumps({"dependencies": digests, "objects": data}, separators=(",", ":")),
+            encoding="utf8",
+        )
+        os.replace(temporary, entry)
+        self.writes += 1
+
+    def stats(self) -> dict[str, int | None]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
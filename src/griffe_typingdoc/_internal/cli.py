@@ -0,0 +1,174 @@
+# Command-line interface loading packages in bulk and reporting the extraction throughput.
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from griffe import Extensions, GriffeLoader
+
+from griffe_typingdoc._internal import debug
+from griffe_typingdoc._internal.extension import TypingDocExtension
+
+if TYPE_CHECKING:
+    from griffe import Module
+
+# Number of modules listed in the summary, slowest first. The full list is part of the JSON report.
+_slowest_modules = 10
+
+
+class _DebugInfo(argparse.Action):
+    def __init__(self, nargs: int | str | None = 0, **kwargs: Any) -> None:
+        super().__init__(nargs=nargs, **kwargs)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        debug._print_debug_info()
+        sys.exit(0)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser.
+
+    Returns:
+        An argparse parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="griffe-typingdoc",
+        description="Load packages with the TypingDoc extension and report the extraction throughput.",
+    )
+    parser.add_argument("packages", metavar="PACKAGE", nargs="+", help="Packages to load.")
+    parser.add_argument(
+        "-s",
+        "--search",
+        dest="search_paths",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Path in which to search packages, before `sys.path`. Can be repeated.",
+    )
+    parser.add_argument(
+        "-d",
+        "--dynamic",
+        action="store_true",
+        help="Import and inspect packages instead of visiting their source.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="File in which to dump the extracted sections, as an index.",
+    )
+    parser.add_argument("-r", "--report", metavar="FILE", help="File in which to write the statistics as JSON.")
+    parser.add_argument("-c", "--cache-dir", metavar="DIR", help="Directory in which to persist extracted sections.")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="Number of extraction threads.")
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {debug._get_version()}")
+    parser.add_argument("--debug-info", action=_DebugInfo, help="Print debug information.")
+    return parser
+
+
+def _count_objects(module: Module) -> int:
+    # Functions and attributes are the objects the extension extracts sections from.
+    count = 0
+    stack: list[Any] = [module]
+    while stack:
+        obj = stack.pop()
+        for member in obj.members.values():
+            if member.is_alias:
+                continue
+            if member.is_function or member.is_attribute:
+                count += 1
+            else:
+                stack.append(member)
+    return count
+
+
+def _hit_rates(caches: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    rates = {}
+    for name, stats in caches.items():
+        hits, misses = stats["hits"], stats["misses"]
+        rates[name] = {"hits": hits, "misses": misses, "rate": hits / (hits + misses) if hits + misses else None}
+    return rates
+
+
+def _print_summary(report: dict[str, Any]) -> None:
+    for package, stats in report["packages"].items():
+        if "error" in stats:
+            print(f"{package}: error: {stats['error']}", file=sys.stderr)
+        else:
+            print(
+                f"{package}: {stats['objects']} objects in {stats['seconds']:.3f}s "
+                f"({stats['objects_per_second']:.1f} objects/s)",
+                file=sys.stderr,
+            )
+    if report["modules"]:
+        print("Slowest modules:", file=sys.stderr)
+        for module, seconds in list(report["modules"].items())[:_slowest_modules]:
+            print(f"  {module}: {seconds * 1000:.2f}ms", file=sys.stderr)
+    print("Cache hit rates:", file=sys.stderr)
+    for name, stats in report["caches"].items():
+        rate = "n/a" if stats["rate"] is None else f"{stats['rate']:.1%}"
+        print(f"  {name}: {rate} ({stats['hits']} hits, {stats['misses']} misses)", file=sys.stderr)
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the main program.
+
+    This function is executed when you type `griffe-typingdoc` or `python -m griffe_typingdoc`.
+
+    Parameters:
+        args: Arguments passed from the command line.
+
+    Returns:
+        An exit code: 1 if a package could not be loaded or processed, 0 otherwise.
+    """
+    parser = get_parser()
+    opts = parser.parse_args(args=args)
+
+    extension = TypingDocExtension(
+        cache_dir=opts.cache_dir,
+        workers=opts.workers,
+        profile=True,
+        index_output=opts.output,
+    )
+    loader = GriffeLoader(
+        extensions=Extensions(extension),
+        search_paths=[*opts.search_paths, *sys.path],
+        force_inspection=opts.dynamic,
+    )
+
+    failed = False
+    packages: dict[str, dict[str, Any]] = {}
+    for package in opts.packages:
+        start = time.perf_counter()
+        try:
+            module = loader.load(package)
+        except Exception as error:  # noqa: BLE001
+            failed = True
+            packages[package] = {"error": f"{error.__class__.__name__}: {error}"}
+            continue
+        seconds = time.perf_counter() - start
+        objects = _count_objects(module)  # type: ignore[arg-type]
+        packages[package] = {
+            "objects": objects,
+            "seconds": seconds,
+            "objects_per_second": objects / seconds if seconds else 0.0,
+        }
+
+    modules = {
+        name[len("modules.") :]: stats["seconds"]
+        for name, stats in extension.profile_stats.items()
+        if name.startswith("modules.")
+    }
+    report = {
+        "packages": packages,
+        "modules": dict(sorted(modules.items(), key=lambda item: item[1], reverse=True)),
+        "caches": _hit_rates(extension.cache_stats),
+    }
+    _print_summary(report)
+    if opts.report:
+        with open(opts.report, "w", encoding="utf8") as file:
+            json.dump(report, file, indent=2)
+    return 1 if failed else 0
@@ -0,0 +1,64 @@
+# State of an extension instance, passed to the extraction engines.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from griffe_typingdoc._internal.cache import _LRUCache
+from griffe_typingdoc._internal.profiling import _Profiler
+from griffe_typingdoc._internal.registry import _kinds
+
+if TYPE_CHECKING:
+    from griffe_typingdoc._internal.records import _Item, _Metadata
+
+
+class _Context:
+    """Supported constructs, caches and profiler of an extension instance, shared by the functions of both engines."""
+
+    __slots__ = (
+        "alias_cache",
+        "hints_cache",
+        "kinds",
+        "literal_cache",
+        "metadata_cache",
+        "profiler",
+        "runtime_typed_dict_cache",
+        "typed_dict_cache",
+    )
+
+    def __init__(self, cache_size: int | None = 1024, kinds: dict[str, str] = _kinds) -> None:
+        self.kinds = kinds
+        """Canonical paths of supported objects, mapped to the kind of construct they represent."""
+        self.metadata_cache: _LRUCache[tuple[str, str], _Metadata] = _LRUCache(cache_size)
+        """Metadata of static annotations, keyed on their scope and source."""
+        self.literal_cache: _LRUCache[str, str] = _LRUCache(cache_size)
+        """Documentation strings, keyed on their source."""
+        self.typed_dict_cache: _LRUCache[str, dict[str, _Item]] = _LRUCache(cache_size)
+        """Documented keys of static typed dicts, keyed on their path."""
+        self.alias_cache: _LRUCache[str, _Metadata] = _LRUCache(cache_size)
+        """Metadata of static type aliases, keyed on their path."""
+        self.hints_cache: _LRUCache[str, dict[str, Any]] = _LRUCache(maxsize=None)
+        """Runtime type hints, keyed on the path of their object."""
+        self.runtime_typed_dict_cache: _LRUCache[type, list[_Item]] = _LRUCache(cache_size)
+        """Documented keys of runtime typed dicts, keyed on their class."""
+        self.profiler = _Profiler()
+        """Time spent in each extraction phase, when enabled."""
+
+    def stats(self) -> dict[str, dict[str, int | None]]:
+        return {
+            "metadata": self.metadata_cache.stats(),
+            "literals": self.literal_cache.stats(),
+            "typed_dicts": self.typed_dict_cache.stats(),
+            "aliases": self.alias_cache.stats(),
+            "type_hints": self.hints_cache.stats(),
+            "runtime_typed_dicts": self.runtime_typed_dict_cache.stats(),
+        }
+
+    def clear(self) -> None:
+        # Cached data is keyed on object paths: drop it so that reloaded objects are processed again.
+        # Documentation strings only depend on their source and are kept.
+        self.metadata_cache.clear()
+        self.typed_dict_cache.clear()
+        self.alias_cache.clear()
+        self.hints_cache.clear()
+        self.runtime_typed_dict_cache.clear()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from griffe import (
+    Docstring,
     DocstringParameter,
     DocstringRaise,
     DocstringReceive,
@@ -19,113 +21,136 @@ from griffe import (
     DocstringSectionYields,
     DocstringWarn,
     DocstringYield,
+    Expr,
+    ExprName,
+    ParameterKind,
 )
 
+from griffe_typingdoc._internal.records import _Item, _Parameter
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-    from griffe import Function, Parameter
+    from griffe import Attribute, DocstringSection, Function
+
+    from griffe_typingdoc._internal.profiling import _Profiler
+
+
+_stars = {ParameterKind.var_positional: "*", ParameterKind.var_keyword: "**"}
 
 
-def _no_self_params(func: Function) -> list[Parameter]:
+def _parameters(func: Function) -> tuple[_Parameter, ...]:
+    # Parameters are walked once per function, and the resulting read-only view is shared by the section builders.
+    parameters = iter(func.parameters)
     if func.parent and func.parent.is_class and func.parameters and func.parameters[0].name in {"self", "cls"}:
-        return list(func.parameters)[1:]
-    return list(func.parameters)
+        next(parameters)
+    return tuple(
+        _Parameter(
+            parameter.name,
+            parameter.kind,
+            _stars.get(parameter.kind, ""),
+            parameter.annotation,
+            parameter.default,
+        )
+        for parameter in parameters
+    )
 
 
-def _to_parameters_section(params_dict: dict[str, dict[str, Any]], func: Function) -> DocstringSectionParameters:
+def _to_parameters_section(params: Iterable[_Item]) -> DocstringSectionParameters:
+    # Default values are recorded while walking parameters, rather than looked up by name for each parameter.
     return DocstringSectionParameters(
         [
             DocstringParameter(
-                name=param_name,
-                description=param_doc["description"],
-                annotation=param_doc["annotation"],
-                value=func.parameters[param_name].default,
+                name=param.name,
+                description=param.description,
+                annotation=param.annotation,
+                value=param.value,
             )
-            for param_name, param_doc in params_dict.items()
+            for param in params
         ],
     )
 
 
-def _to_other_parameters_section(params_dict: dict[str, dict[str, Any]]) -> DocstringSectionOtherParameters:
+def _to_other_parameters_section(params: Iterable[_Item]) -> DocstringSectionOtherParameters:
+    # Items of a typed dict are collected once and shared by every function unpacking it:
+    # each function still gets its own section, so that sections can be modified in place.
     return DocstringSectionOtherParameters(
         [
             DocstringParameter(
-                name=param_name,
-                description=param_doc["description"],
-                annotation=param_doc["annotation"],
+                name=param.name,
+                description=param.description,
+                annotation=param.annotation,
             )
-            for param_name, param_doc in params_dict.items()
+            for param in params
         ],
     )
 
 
-def _to_yields_section(yield_data: Iterable[dict[str, Any]]) -> DocstringSectionYields:
+def _to_yields_section(yield_data: Iterable[_Item]) -> DocstringSectionYields:
     return DocstringSectionYields(
         [
             DocstringYield(
-                name=yield_dict.get("name", ""),
-                description=yield_dict.get("doc", ""),
-                annotation=yield_dict["annotation"],
+                name=item.name,
+                description=item.description,
+                annotation=item.annotation,
             )
-            for yield_dict in yield_data
+            for item in yield_data
         ],
     )
 
 
-def _to_receives_section(receive_data: Iterable[dict[str, Any]]) -> DocstringSectionReceives:
+def _to_receives_section(receive_data: Iterable[_Item]) -> DocstringSectionReceives:
     return DocstringSectionReceives(
         [
             DocstringReceive(
-                name=receive_dict.get("name", ""),
-                description=receive_dict.get("doc", ""),
-                annotation=receive_dict["annotation"],
+                name=item.name,
+                description=item.description,
+                annotation=item.annotation,
             )
-            for receive_dict in receive_data
+            for item in receive_data
         ],
     )
 
 
-def _to_returns_section(return_data: Iterable[dict[str, Any]]) -> DocstringSectionReturns:
+def _to_returns_section(return_data: Iterable[_Item]) -> DocstringSectionReturns:
     return DocstringSectionReturns(
         [
             DocstringReturn(
-                name=return_dict.get("name", ""),
-                description=return_dict.get("doc", ""),
-                annotation=return_dict["annotation"],
+                name=item.name,
+                description=item.description,
+                annotation=item.annotation,
             )
-            for return_dict in return_data
+            for item in return_data
         ],
     )
 
 
-def _to_warns_section(warn_data: Iterable[dict[str, Any]]) -> DocstringSectionWarns:
+def _to_warns_section(warn_data: Iterable[_Item]) -> DocstringSectionWarns:
     return DocstringSectionWarns(
         [
             DocstringWarn(
-                annotation=warn_dict["annotation"],
-                description=warn_dict.get("description", ""),
+                annotation=item.annotation,
+                description=item.description,
             )
-            for warn_dict in warn_data
+            for item in warn_data
         ],
     )
 
 
-def _to_raises_section(raise_data: Iterable[dict[str, Any]]) -> DocstringSectionRaises:
+def _to_raises_section(raise_data: Iterable[_Item]) -> DocstringSectionRaises:
     return DocstringSectionRaises(
         [
             DocstringRaise(
-                annotation=raise_dict["annotation"],
-                description=raise_dict.get("description", ""),
+                annotation=item.annotation,
+                description=item.description,
             )
-            for raise_dict in raise_data
+            for item in raise_data
         ],
     )
 
 
-def _to_deprecated_section(deprecation_data: dict[str, Any]) -> DocstringSectionAdmonition:
-    description = deprecation_data["description"]
-    description_lines = deprecation_data["description"].split("\n")
+def _to_deprecated_section(description: str) -> DocstringSectionAdmonition:
+    description_lines = description.split("\n")
     if len(description_lines) > 1:
         title = description_lines[0].strip()
         description = "\n".join(description_lines[1:]).strip()
@@ -133,3 +158,150 @@ def _to_deprecated_section(deprecation_data: dict[str, Any]) -> DocstringSection
         title = description
         description = ""
     return DocstringSectionAdmonition(kind="danger", title=title, text=description)
+
+
+class _LazyDocstring(Docstring):
+    """A docstring merging extracted sections only once it is parsed."""
+
+    def __init__(self, *args: Any, sections: dict[str, Any], profiler: _Profiler, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._sections = sections
+        self._profiler = profiler
+
+    @cached_property
+    def parsed(self) -> list[DocstringSection]:
+        with self._profiler.phase("docstring_parsing"):
+            parsed = self.parse()
+        _insert_sections(parsed, self._sections)
+        return parsed
+
+
+def _merge_sections(
+    attr_or_func: Attribute | Function,
+    sections: dict[str, Any],
+    *,
+    profiler: _Profiler,
+    lazy: bool = False,
+) -> None:
+    if not any(sections.values()):
+        return
+
+    with profiler.phase("merge"):
+        docstring = attr_or_func.docstring
+        if lazy and "parsed" not in (docstring.__dict__ if docstring else {}):
+            # Defer parsing until sections are actually read, for example when rendering.
+            attr_or_func.docstring = _LazyDocstring(
+                docstring.value if docstring else sections.get("docstring", ""),
+                lineno=docstring.lineno if docstring else None,
+                endlineno=docstring.endlineno if docstring else None,
+                parent=attr_or_func,
+                parser=docstring.parser if docstring else None,
+                parser_options=docstring.parser_options if docstring else None,
+                sections=sections,
+                profiler=profiler,
+            )
+            return
+
+        if not docstring:
+            docstring = attr_or_func.docstring = Docstring(sections.get("docstring", ""), parent=attr_or_func)
+
+        with profiler.phase("docstring_parsing"):
+            parsed = docstring.parsed
+
+        _insert_sections(parsed, sections)
+
+
+def _insert_sections(parsed: list[DocstringSection], sections: dict[str, Any]) -> None:
+    if sections.get("other_parameters"):
+        parsed.insert(1, sections["other_parameters"])
+
+    if sections.get("parameters"):
+        parsed.insert(1, sections["parameters"])
+
+    if sections.get("deprecated"):
+        parsed.insert(0, sections["deprecated"])
+
+    for kind in ("raises", "warns", "yields", "receives", "returns"):
+        if sections.get(kind):
+            parsed.append(sections[kind])
+
+
+def _annotation_as_dict(annotation: str | Expr | None) -> Any:
+    if not isinstance(annotation, Expr):
+        return annotation
+    # Names are serialized without their parent: remember the scope in which they resolve.
+    scope = next(
+        (
+            name.parent.path
+            for name in annotation.iterate(flat=True)
+            if isinstance(name, ExprName) and name.parent is not None and not isinstance(name.parent, (str, ExprName))
+        ),
+        None,
+    )
+    return {"expression": annotation.as_dict(), "scope": scope}
+
+
+def _annotation_from_dict(data: Any, attr_or_func: Attribute | Function) -> str | Expr | None:
+    if not isinstance(data, dict):
+        return data
+    annotation = data["expression"]
+    if data["scope"] is not None:
+        scope = attr_or_func.modules_collection[data["scope"]]
+        for name in annotation.iterate(flat=True):
+            if isinstance(name, ExprName) and name.parent is None:
+                name.parent = scope
+    return annotation
+
+
+def _sections_as_dict(sections: dict[str, Any]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for kind, section in sections.items():
+        if not section:
+            continue
+        if kind == "docstring":
+            data[kind] = section
+        elif kind == "deprecated":
+            data[kind] = {"title": section.title, "text": section.value.description}
+        elif kind in {"raises", "warns"}:
+            data[kind] = [
+                {"annotation": _annotation_as_dict(item.annotation), "description": item.description}
+                for item in section.value
+            ]
+        else:
+            data[kind] = [
+                {"name": item.name, "annotation": _annotation_as_dict(item.annotation), "description": item.description}
+                for item in section.value
+            ]
+    return data
+
+
+def _sections_from_dict(data: dict[str, Any], attr_or_func: Attribute | Function) -> dict[str, Any]:
+    sections: dict[str, Any] = {}
+    for kind, value in data.items():
+        if kind == "docstring":
+            sections[kind] = value
+        elif kind == "deprecated":
+            sections[kind] = DocstringSectionAdmonition(kind="danger", title=value["title"], text=value["text"])
+        elif kind in {"raises", "warns"}:
+            items = [
+                _Item(_annotation_from_dict(item["annotation"], attr_or_func), item["description"]) for item in value
+            ]
+            sections[kind] = _to_raises_section(items) if kind == "raises" else _to_warns_section(items)
+        else:
+            items = [
+                _Item(_annotation_from_dict(item["annotation"], attr_or_func), item["description"], item["name"])
+                for item in value
+            ]
+            if kind == "parameters":
+                defaults = {parameter.name: parameter.default for parameter in _parameters(attr_or_func)}  # type: ignore[arg-type]
+                for item in items:
+                    item.value = defaults.get(item.name.lstrip("*"))
+                sections[kind] = _to_parameters_section(items)
+            else:
+                sections[kind] = {
+                    "other_parameters": _to_other_parameters_section,
+                    "yields": _to_yields_section,
+                    "receives": _to_receives_section,
+                    "returns": _to_returns_section,
+                }[kind](items)
+    return sections
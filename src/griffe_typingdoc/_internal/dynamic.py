@@ -2,11 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, get_type_hints
+import inspect
+from typing import TYPE_CHECKING, Any, get_args, get_origin, get_type_hints
 
-from griffe_typingdoc._internal.docstrings import _to_parameters_section
+from griffe import ParameterKind
+
+from griffe_typingdoc._internal.docstrings import (
+    _parameters,
+    _to_deprecated_section,
+    _to_other_parameters_section,
+    _to_parameters_section,
+    _to_raises_section,
+    _to_receives_section,
+    _to_returns_section,
+    _to_warns_section,
+    _to_yields_section,
+)
+from griffe_typingdoc._internal.records import _Item, _Metadata, _no_metadata, _Parameter
+from griffe_typingdoc._internal.registry import _kind, _runtime_kind
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from griffe import (
         Attribute,
         DocstringSectionAdmonition,
@@ -21,107 +38,298 @@ if TYPE_CHECKING:
         ObjectNode,
     )
 
+    from griffe_typingdoc._internal.context import _Context
 
-def _hints(node: ObjectNode) -> dict[str, str]:
-    try:
-        return get_type_hints(node.obj, include_extras=True)
-    except TypeError:
-        if node.parent:
-            return _hints(node.parent)
-    return {}
 
+def _hints(node: ObjectNode, context: _Context) -> dict[str, Any]:
+    # Attributes fall back on the hints of their parent, which are resolved once per load.
+    hints = context.hints_cache.get(node.path)
+    if hints is None:
+        try:
+            with context.profiler.phase("type_hints"):
+                hints = get_type_hints(node.obj, include_extras=True)
+        except TypeError:
+            hints = _hints(node.parent, context) if node.parent else {}
+        context.hints_cache.set(node.path, hints)
+    return hints
 
-def _doc(name: str, hints: dict[str, Any]) -> str | None:
-    try:
-        return hints[name].__metadata__[0].documentation
-    except (AttributeError, KeyError):
+
+def _annotation(hint: Any) -> str:
+    # Metadata is already rendered in sections: only show the annotated type.
+    if hasattr(hint, "__metadata__"):
+        hint = hint.__origin__
+    return inspect.formatannotation(hint)
+
+
+# Kinds of the top-level annotations from which sections are built: other objects can be skipped early.
+_documented_kinds = {"Unpack", "Generator", "Iterator"}
+
+# Type qualifiers of typed dict keys, wrapping their actual annotation.
+_qualifiers = {"Required", "NotRequired", "ReadOnly"}
+
+
+def _unqualified(hint: Any, context: _Context) -> Any:
+    while _origin_kind(hint, context) in _qualifiers:
+        hint = get_args(hint)[0]
+    return hint
+
+
+def _origin_kind(hint: Any, context: _Context) -> str | None:
+    origin = get_origin(hint)
+    if origin is None:
         return None
+    return _kind(f"{getattr(origin, '__module__', '')}.{getattr(origin, '__qualname__', '')}", context.kinds)
+
+
+# Runtime objects are expected to store their arguments like `Doc` stores its documentation,
+# for example `Raises(ValueError, "When...")` as `exception` and `documentation` attributes.
+# Raises and Warns objects lacking them, for example objects registered with the `aliases` option, are skipped.
+def _metadata(hint: Any, context: _Context) -> _Metadata:
+    try:
+        annotated_data = hint.__metadata__
+    except AttributeError:
+        return _no_metadata
+    metadata = _Metadata()
+    for data in annotated_data:
+        kind = _runtime_kind(data, context.kinds)
+        if kind == "Doc":
+            metadata.doc = inspect.cleandoc(data.documentation)
+        elif kind == "deprecated":
+            metadata.deprecated = inspect.cleandoc(data.message)
+        elif kind == "Name":
+            metadata.name = data.name
+        elif kind in {"Raises", "Warns"}:
+            raised = getattr(data, "exception" if kind == "Raises" else "warning", None)
+            documentation = getattr(data, "documentation", None)
+            if raised is None or not isinstance(documentation, str):
+                continue
+            item = ((_annotation(raised), inspect.cleandoc(documentation)),)
+            if kind == "Raises":
+                metadata.raises += item
+            else:
+                metadata.warns += item
+    return metadata
+
+
+def _elements(hint: Any) -> tuple[Any, ...]:
+    if get_origin(hint) is tuple:
+        return get_args(hint)
+    return (hint,)
+
+
+def _items(hints: Iterable[Any], context: _Context) -> list[_Item]:
+    return [
+        _Item(_annotation(hint), metadata.doc, metadata.name or "")
+        for hint in hints
+        if (metadata := _metadata(hint, context)).doc is not None
+    ]
+
+
+def _attribute_hint(attr: Attribute, node: ObjectNode, context: _Context) -> Any:
+    # Attributes are annotated in their parent, whose hints are resolved once for all its attributes.
+    return _hints(node.parent, context).get(attr.name) if node.parent else None
+
+
+def _annotated(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    node: ObjectNode,
+    **kwargs: Any,  # noqa: ARG001
+) -> bool:
+    hints: Iterable[Any]
+    if attr_or_func.is_attribute:
+        hints = [_attribute_hint(attr_or_func, node, context)]  # type: ignore[arg-type]
+    else:
+        hints = _hints(node, context).values()
+    return any(hasattr(hint, "__metadata__") or _origin_kind(hint, context) in _documented_kinds for hint in hints)
 
 
-def _attribute_docs(attr: Attribute, *, node: ObjectNode, **kwargs: Any) -> str:  # noqa: ARG001
-    return _doc(attr.name, _hints(node)) or ""
+def _attribute_docs(
+    attr: Attribute,
+    *,
+    context: _Context,
+    node: ObjectNode,
+    metadata: _Metadata | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> str:
+    if metadata is None:
+        metadata = _metadata(_attribute_hint(attr, node, context), context)
+    return metadata.doc or ""
 
 
 def _parameters_docs(
     func: Function,
     *,
+    context: _Context,
     node: ObjectNode,
+    parameters: Sequence[_Parameter] | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionParameters | None:
-    hints = _hints(node)
-    params_doc: dict[str, dict[str, Any]] = {
-        name: {"description": _doc(name, hints)} for name in hints if name != "return"
-    }
-    if params_doc:
-        return _to_parameters_section(params_doc, func)
+    hints = _hints(node, context)
+    params_data: list[_Item] = []
+    for parameter in _parameters(func) if parameters is None else parameters:
+        metadata = _metadata(hints.get(parameter.name), context)
+        if metadata.deprecated is not None or metadata.doc is not None:
+            description = f"{metadata.deprecated or ''} {metadata.doc or ''}".lstrip()
+            params_data.append(
+                _Item(parameter.annotation, description, f"{parameter.stars}{parameter.name}", parameter.default),
+            )
+    if params_data:
+        return _to_parameters_section(params_data)
     return None
 
 
-# FIXME: Implement this function.
+def _annotation_metadata(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    node: ObjectNode,
+    **kwargs: Any,  # noqa: ARG001
+) -> _Metadata:
+    if attr_or_func.is_attribute:
+        return _metadata(_attribute_hint(attr_or_func, node, context), context)  # type: ignore[arg-type]
+    if attr_or_func.is_function:
+        return _metadata(_hints(node, context).get("return"), context)
+    return _no_metadata
+
+
+def _typed_dict_docs(typed_dict: type, context: _Context) -> list[_Item]:
+    # Annotations of typed dicts already include the keys inherited from their bases.
+    cached = context.runtime_typed_dict_cache.get(typed_dict)
+    if cached is None:
+        try:
+            with context.profiler.phase("type_hints"):
+                hints = get_type_hints(typed_dict, include_extras=True)
+        except (NameError, TypeError):
+            hints = {}
+        params_data = []
+        for name, hint in hints.items():
+            key_hint = _unqualified(hint, context)
+            if (description := _metadata(key_hint, context).doc) is not None:
+                params_data.append(_Item(_annotation(key_hint), description, name))
+        cached = params_data
+        context.runtime_typed_dict_cache.set(typed_dict, cached)
+    return cached
+
+
 def _other_parameters_docs(
-    func: Function,  # noqa: ARG001
+    func: Function,
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
+    parameters: Sequence[_Parameter] | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionOtherParameters | None:
+    if parameters is None:
+        parameters = _parameters(func)
+    if parameters and parameters[-1].kind is ParameterKind.var_keyword:
+        hint: Any = _hints(node, context).get(parameters[-1].name)
+        if hasattr(hint, "__metadata__"):
+            hint = hint.__origin__
+        if (
+            _origin_kind(hint, context) == "Unpack"
+            and isinstance(typed_dict := get_args(hint)[0], type)
+            and (params_data := _typed_dict_docs(typed_dict, context))
+        ):
+            return _to_other_parameters_section(params_data)
     return None
 
 
-# FIXME: Implement this function.
 def _deprecated_docs(
-    attr_or_func: Attribute | Function,  # noqa: ARG001
+    attr_or_func: Attribute | Function,
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
+    metadata: _Metadata | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionAdmonition | None:
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context, node=node)
+    if metadata.deprecated is not None:
+        return _to_deprecated_section(metadata.deprecated)
     return None
 
 
-# FIXME: Implement this function.
 def _raises_docs(
-    attr_or_func: Attribute | Function,  # noqa: ARG001
+    attr_or_func: Attribute | Function,
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
+    metadata: _Metadata | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionRaises | None:
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context, node=node)
+    if metadata.raises:
+        return _to_raises_section(_Item(*raised) for raised in metadata.raises)
     return None
 
 
-# FIXME: Implement this function.
 def _warns_docs(
-    attr_or_func: Attribute | Function,  # noqa: ARG001
+    attr_or_func: Attribute | Function,
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
+    metadata: _Metadata | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionWarns | None:
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context, node=node)
+    if metadata.warns:
+        return _to_warns_section(_Item(*warned) for warned in metadata.warns)
     return None
 
 
-# FIXME: Implement this function.
 def _yields_docs(
     func: Function,  # noqa: ARG001
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionYields | None:
+    hint = _hints(node, context).get("return")
+    # Bare or partially subscripted generators and iterators lack the type arguments we read.
+    if (
+        _origin_kind(hint, context) in {"Generator", "Iterator"}
+        and len(args := get_args(hint)) > 0
+        and (yield_data := _items(_elements(args[0]), context))
+    ):
+        return _to_yields_section(yield_data)
     return None
 
 
-# FIXME: Implement this function.
 def _receives_docs(
     func: Function,  # noqa: ARG001
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionReceives | None:
+    hint = _hints(node, context).get("return")
+    if (
+        _origin_kind(hint, context) == "Generator"
+        and len(args := get_args(hint)) > 1
+        and (receive_data := _items(_elements(args[1]), context))
+    ):
+        return _to_receives_section(receive_data)
     return None
 
 
-# FIXME: Implement this function.
 def _returns_docs(
     func: Function,  # noqa: ARG001
     *,
-    node: ObjectNode,  # noqa: ARG001
+    context: _Context,
+    node: ObjectNode,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionReturns | None:
+    hint = _hints(node, context).get("return")
+    if _origin_kind(hint, context) == "Generator":
+        if len(args := get_args(hint)) < 3:  # noqa: PLR2004
+            return None
+        hint = args[2]
+    elif not hasattr(hint, "__metadata__"):
+        return None
+    if return_data := _items(_elements(hint), context):
+        return _to_returns_section(return_data)
     return None
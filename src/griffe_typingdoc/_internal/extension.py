@@ -2,117 +2,503 @@
 
 from __future__ import annotations
 
+import json
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from fnmatch import translate
 from typing import TYPE_CHECKING, Any
 
-from griffe import Alias, Docstring, Extension, Function, ObjectNode
+from griffe import Alias, ExprSubscript, ExprTuple, Extension, Function, ObjectNode
 
 from griffe_typingdoc._internal import dynamic, static
+from griffe_typingdoc._internal.cache import _DiskCache
+from griffe_typingdoc._internal.context import _Context
+from griffe_typingdoc._internal.debug import _get_version
+from griffe_typingdoc._internal.docstrings import (
+    _merge_sections,
+    _parameters,
+    _sections_as_dict,
+    _sections_from_dict,
+)
+from griffe_typingdoc._internal.index import _columns, _index_version
+from griffe_typingdoc._internal.registry import _aliased_kinds, _kind, _kinds
 
 if TYPE_CHECKING:
     import ast
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
     from typing import Annotated
 
-    from griffe import Attribute, Module, Object
+    from griffe import Attribute, Docstring, Module, Object
     from typing_extensions import Doc
 
 
+# Section kinds, along with the name of the function building them in each engine, in order of extraction.
+_attribute_builders = (
+    ("docstring", "_attribute_docs"),
+    ("deprecated", "_deprecated_docs"),
+    ("raises", "_raises_docs"),
+    ("warns", "_warns_docs"),
+)
+_function_builders = (
+    ("deprecated", "_deprecated_docs"),
+    ("parameters", "_parameters_docs"),
+    ("other_parameters", "_other_parameters_docs"),
+    ("warns", "_warns_docs"),
+    ("raises", "_raises_docs"),
+    ("yields", "_yields_docs"),
+    ("receives", "_receives_docs"),
+    ("returns", "_returns_docs"),
+)
+
+# Kinds of objects that can receive sections.
+_object_kinds = {"attribute", "function"}
+
+
+def _compile_patterns(patterns: Sequence[str] | None) -> re.Pattern | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
+def _annotation_string(annotation: Any, kinds: dict[str, str]) -> str | None:
+    # Metadata is already part of the index: only keep the annotated type.
+    if (
+        isinstance(annotation, ExprSubscript)
+        and _kind(annotation.canonical_path, kinds) == "Annotated"
+        and isinstance(annotation.slice, ExprTuple)
+    ):
+        annotation = annotation.slice.elements[0]
+    return None if annotation is None else str(annotation)
+
+
+def _index_entry(sections: dict[str, Any], kinds: dict[str, str]) -> dict[str, Any]:
+    entry: dict[str, Any] = {}
+    for kind, section in sections.items():
+        if not section:
+            continue
+        if kind == "docstring":
+            entry[kind] = section
+        elif kind == "deprecated":
+            entry[kind] = f"{section.title}\n{section.value.description}".rstrip()
+        elif kind in {"raises", "warns"}:
+            entry[kind] = [[_annotation_string(item.annotation, kinds), item.description] for item in section.value]
+        else:
+            entry[kind] = [
+                [item.name, _annotation_string(item.annotation, kinds), item.description] for item in section.value
+            ]
+    return entry
+
+
+def _dump_index(entries: dict[str, dict[str, Any]], path: str | Path) -> None:
+    paths = sorted(entries)
+    columns = {
+        kind: [entries[obj_path].get(kind) for obj_path in paths]
+        for kind in _columns
+        if any(kind in entries[obj_path] for obj_path in paths)
+    }
+    with open(path, "w", encoding="utf8") as file:
+        json.dump({"version": _index_version, "paths": paths, "columns": columns}, file, separators=(",", ":"))
+
+
 class TypingDocExtension(Extension):
     """Griffe extension that reads documentation from `typing.Doc`."""
 
-    def __init__(self) -> None:
-        self._handled: set[str] = set()
+    def __init__(
+        self,
+        *,
+        cache_size: Annotated[
+            int | None,
+            Doc(
+                """Maximum number of parsed annotations, documentation strings, typed dicts and aliases kept in memory.
+
+                Use `None` for an unbounded cache, and `0` to disable caching.
+                Each extension has its own caches.
+                """,
+            ),
+        ] = 1024,
+        aliases: Annotated[
+            dict[str, str] | None,
+            Doc(
+                """Additional canonical paths to support, mapped to the `typing` object they stand for.
+
+                For example `{"mylib.Doc": "typing_extensions.Doc"}` for an in-house re-export or subclass of `Doc`.
+                When inspecting, instances must store their arguments as attributes, like the objects they stand for:
+                `documentation` for `Doc`, `exception` or `warning` and `documentation` for `Raises` and `Warns`.
+                Aliases only apply to this extension.
+                """,
+            ),
+        ] = None,
+        cache_dir: Annotated[
+            str | Path | None,
+            Doc(
+                """Directory in which to persist the sections extracted from each module.
+
+                Modules whose source did not change since a previous run are not processed again.
+                """,
+            ),
+        ] = None,
+        workers: Annotated[
+            int,
+            Doc(
+                """Number of threads extracting sections in parallel.
+
+                Sections are still merged into docstrings in a deterministic order.
+                Extraction is CPU-bound: values above 1 mostly help on free-threaded Python builds.
+                """,
+            ),
+        ] = 1,
+        profile: Annotated[
+            bool,
+            Doc("Whether to record the time spent in each extraction phase, see `profile_stats`."),
+        ] = False,
+        profile_output: Annotated[
+            str | Path | None,
+            Doc("File in which to write the profiling statistics as JSON, after each package is processed."),
+        ] = None,
+        index_output: Annotated[
+            str | Path | None,
+            Doc(
+                """File in which to write the extracted sections, after each package is processed.
+
+                The index can be read without Griffe, see [`TypingDocIndex`][griffe_typingdoc.TypingDocIndex].
+                """,
+            ),
+        ] = None,
+        lazy: Annotated[
+            bool,
+            Doc(
+                """Whether to defer parsing docstrings and adding sections to them until they are first parsed.
+
+                Useful when only a fraction of the loaded objects is eventually rendered.
+                """,
+            ),
+        ] = False,
+        include: Annotated[
+            Sequence[str] | None,
+            Doc(
+                """Patterns of paths of the attributes and functions to process, for example `mypackage.api.*`.
+
+                Patterns are Unix shell-style wildcards, where `*` also matches dots. All objects are processed by default.
+                """,
+            ),
+        ] = None,
+        exclude: Annotated[
+            Sequence[str] | None,
+            Doc(
+                """Patterns of paths of the objects to skip, along with their members, for example `*._*` for private objects.
+
+                Excluded modules and classes are not traversed at all.
+                """,
+            ),
+        ] = None,
+        kinds: Annotated[
+            Sequence[str] | None,
+            Doc("Kinds of objects to process, among `attribute` and `function`. All kinds are processed by default."),
+        ] = None,
+        on_visit: Annotated[
+            bool,
+            Doc(
+                """Whether to extract sections statically as soon as objects are visited, rather than once the package is loaded.
+
+                Functions unpacking typed dicts, and objects whose annotations use names that are not known yet,
+                for example aliases defined in modules that are not loaded yet, are still processed once the package is loaded.
+                """,
+            ),
+        ] = False,
+    ) -> None:
+        # Processed objects are tracked by identity: entries go away with the objects themselves,
+        # and objects loaded again are processed again without having to be invalidated.
+        self._handled: weakref.WeakSet[Object] = weakref.WeakSet()
+        self._workers = workers
+        self._lazy = lazy
+        self._include = _compile_patterns(include)
+        self._exclude = _compile_patterns(exclude)
+        if kinds is not None and (unsupported := set(kinds) - _object_kinds):
+            raise ValueError(f"Cannot filter on unsupported kinds {sorted(unsupported)}")
+        self._object_kinds = None if kinds is None else set(kinds)
+        self._on_visit = on_visit
+        # Docstrings of attributes processed while visiting, which later assignments can forward to new attributes.
+        self._visited_docstrings: weakref.WeakSet[Docstring] = weakref.WeakSet()
+        self._profile_output = profile_output
+        self._index_output = index_output
+        self._index_entries: dict[str, dict[str, Any]] = {}
+        self._context = _Context(cache_size, _aliased_kinds(aliases) if aliases else _kinds)
+        self._context.profiler.enabled = profile or profile_output is not None
+        self._disk_cache: _DiskCache | None = None
+        if cache_dir is not None:
+            # Filters and the processing mode decide which objects are stored: changing them must invalidate cached modules.
+            filters = [list(include or ()), list(exclude or ()), sorted(kinds or ()), on_visit]
+            fingerprint = json.dumps([_get_version(), sorted(self._context.kinds.items()), filters])
+            self._disk_cache = _DiskCache(cache_dir, fingerprint=fingerprint)
+
+    @property
+    def cache_stats(self) -> Annotated[dict[str, dict[str, int | None]], Doc("Statistics for each cache.")]:
+        """Hit, miss and eviction counters of the extension's caches, with their current and maximum sizes.
+
+        Counters are cumulative over the life of the extension, and can be used to tune the `cache_size` option.
+        """
+        stats = self._context.stats()
+        if self._disk_cache is not None:
+            stats["disk"] = self._disk_cache.stats()
+        return stats
 
-    def _handle_attribute(self, attr: Attribute, /, *, node: ObjectNode | None = None) -> None:
-        if attr.path in self._handled:
-            return
-        self._handled.add(attr.path)
+    @property
+    def profile_stats(
+        self,
+    ) -> Annotated[dict[str, dict[str, Any]], Doc("Number of calls and cumulative seconds per phase.")]:
+        """Time spent in each extraction phase, when profiling is enabled.
+
+        Phases are `metadata` (parsing annotations), `type_hints` (resolving runtime annotations),
+        `docstring_parsing` (parsing existing docstrings), `merge` (adding sections to docstrings),
+        `sections.<kind>` for each kind of section, and `modules.<path>` for the objects of each module,
+        whether they are processed as soon as they are loaded or once their package is loaded
+        (`objects` for objects processed on their own). Phases nest: the time of a phase includes
+        the time of the phases it triggers, for example sections include the metadata they parse.
+        """
+        return self._context.profiler.stats()
 
-        module = dynamic if node else static
+    def invalidate(
+        self,
+        path: Annotated[str, Doc("Path of the object to forget, along with its members.")],
+    ) -> None:
+        """Forget that an object and its members were processed.
 
-        new_sections = (
-            docstring := module._attribute_docs(attr, node=node),
-            deprecated_section := module._deprecated_docs(attr, node=node),
-            raises_section := module._raises_docs(attr, node=node),
-            warns_section := module._warns_docs(attr, node=node),
-        )
+        Objects loaded again are always processed again: use it when the same objects
+        must be processed again, for example after their docstrings were reset.
+        """
+        prefix = f"{path}."
+        for handled in list(self._handled):
+            if handled.path == path or handled.path.startswith(prefix):
+                self._handled.discard(handled)
 
-        if not any(new_sections):
-            return
+    def reset(self) -> None:
+        """Forget every processed object, for example between the packages of a long-running loader."""
+        self._handled.clear()
 
-        if not attr.docstring:
-            attr.docstring = Docstring(docstring, parent=attr)
+    def refresh(
+        self,
+        obj: Annotated[Object, Doc("The freshly loaded object to process, along with its members.")],
+    ) -> None:
+        """Process an object and its members again, leaving the rest of the package untouched.
 
-        sections = attr.docstring.parsed
+        The object must have been loaded again since it was last processed,
+        otherwise sections would be added twice to its docstring.
+        """
+        self.invalidate(obj.path)
+        self._handle_object(obj)
+        self._context.clear()
 
-        if deprecated_section:
-            sections.insert(0, deprecated_section)
+    def _merge(self, obj: Attribute | Function, sections: dict[str, Any]) -> None:
+        _merge_sections(obj, sections, profiler=self._context.profiler, lazy=self._lazy)
+        if self._index_output is not None and (entry := _index_entry(sections, self._context.kinds)):
+            self._index_entries[obj.path] = entry
 
-        if raises_section:
-            sections.append(raises_section)
+    def _attribute_sections(self, attr: Attribute, /, *, node: ObjectNode | None = None) -> dict[str, Any]:
+        return self._sections(attr, _attribute_builders, node=node)
 
-        if warns_section:
-            sections.append(warns_section)
+    def _function_sections(self, func: Function, /, *, node: ObjectNode | None = None) -> dict[str, Any]:
+        return self._sections(func, _function_builders, node=node)
 
-    def _handle_function(self, func: Function, /, *, node: ObjectNode | None = None) -> None:
-        if func.path in self._handled:
-            return
-        self._handled.add(func.path)
-
-        module = dynamic if node else static
-
-        new_sections = (
-            deprecated_section := module._deprecated_docs(func, node=node),
-            params_section := module._parameters_docs(func, node=node),
-            other_params_section := module._other_parameters_docs(func, node=node),
-            warns_section := module._warns_docs(func, node=node),
-            raises_section := module._raises_docs(func, node=node),
-            yields_section := module._yields_docs(func, node=node),
-            receives_section := module._receives_docs(func, node=node),
-            returns_section := module._returns_docs(func, node=node),
+    def _sections(
+        self,
+        obj: Attribute | Function,
+        builders: tuple[tuple[str, str], ...],
+        *,
+        node: ObjectNode | None = None,
+    ) -> dict[str, Any]:
+        engine = dynamic if node else static
+        parameters = _parameters(obj) if obj.is_function else None  # type: ignore[arg-type]
+        context = self._context
+        if not engine._annotated(obj, context=context, node=node, parameters=parameters):
+            return {}
+        metadata = engine._annotation_metadata(obj, context=context, node=node)
+        sections = {}
+        for kind, builder in builders:
+            with context.profiler.phase(f"sections.{kind}"):
+                sections[kind] = getattr(engine, builder)(
+                    obj,
+                    context=context,
+                    node=node,
+                    metadata=metadata,
+                    parameters=parameters,
+                )
+        return sections
+
+    def _excluded(self, obj: Object | Alias) -> bool:
+        return self._exclude is not None and self._exclude.match(obj.path) is not None
+
+    def _selected(self, obj: Object) -> bool:
+        # Only attributes and functions are selected: containers are pruned through `_excluded`.
+        return (self._object_kinds is None or obj.kind.value in self._object_kinds) and (
+            self._include is None or self._include.match(obj.path) is not None
         )
 
-        if not any(new_sections):
+    def _hook_selected(self, obj: Object) -> bool:
+        # Hooks are triggered for objects whose parents were not traversed, so check them as well.
+        if not self._selected(obj):
+            return False
+        if self._exclude is None:
+            return True
+        parts = obj.path.split(".")
+        return not any(self._exclude.match(".".join(parts[:index])) for index in range(1, len(parts) + 1))
+
+    def _handle_attribute(self, attr: Attribute, /, *, node: ObjectNode | None = None) -> dict[str, Any] | None:
+        if attr in self._handled or not self._hook_selected(attr):
+            return None
+        self._handled.add(attr)
+        sections = self._attribute_sections(attr, node=node)
+        self._merge(attr, sections)
+        return sections
+
+    def _handle_function(self, func: Function, /, *, node: ObjectNode | None = None) -> dict[str, Any] | None:
+        if func in self._handled or not self._hook_selected(func):
+            return None
+        self._handled.add(func)
+        sections = self._function_sections(func, node=node)
+        self._merge(func, sections)
+        return sections
+
+    def _visit_attribute(self, attr: Attribute) -> None:
+        if attr.docstring is not None and attr.docstring in self._visited_docstrings:
+            # The attribute replaces one that was already processed, and got its docstring along with its sections.
+            self._handled.add(attr)
             return
+        # Names can refer to objects that are not loaded yet: leave such attributes to `on_package`.
+        if static._unresolved(attr, self._context):
+            return
+        self._handle_attribute(attr)
+        if attr.docstring is not None:
+            self._visited_docstrings.add(attr.docstring)
 
-        if not func.docstring:
-            func.docstring = Docstring("", parent=func)
-
-        sections = func.docstring.parsed
-
-        if other_params_section:
-            sections.insert(1, other_params_section)
-
-        if params_section:
-            sections.insert(1, params_section)
-
-        if deprecated_section:
-            sections.insert(0, deprecated_section)
-
-        if raises_section:
-            sections.append(raises_section)
-
-        if warns_section:
-            sections.append(warns_section)
-
-        if yields_section:
-            sections.append(yields_section)
+    def _visit_function(self, func: Function) -> None:
+        # Overloads, setters and deleters are not members of their parent, and are not processed.
+        if func.parent is None or func.parent.members.get(func.name) is not func:
+            return
+        # Typed dicts and other names can refer to objects that are not loaded yet: leave such functions to `on_package`.
+        parameters = _parameters(func)
+        if static._unpacked_typed_dict(func, self._context, parameters) is not None:
+            return
+        if static._unresolved(func, self._context, parameters):
+            return
+        self._handle_function(func)
 
-        if receives_section:
-            sections.append(receives_section)
+    def _object_sections(self, obj: Attribute | Function) -> dict[str, Any]:
+        if obj.is_function:
+            return self._function_sections(obj)  # type: ignore[arg-type]
+        return self._attribute_sections(obj)  # type: ignore[arg-type]
 
-        if returns_section:
-            sections.append(returns_section)
+    def _extract(
+        self,
+        objects: list[Attribute | Function],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> list[dict[str, Any]]:
+        if executor is not None and len(objects) > 1:
+            return list(executor.map(self._object_sections, objects))
+        return [self._object_sections(obj) for obj in objects]
+
+    def _module_phase(self, obj: Object) -> AbstractContextManager[None]:
+        # Objects processed in instance hooks are timed along with the other objects of their module.
+        profiler = self._context.profiler
+        if not profiler.enabled:
+            return nullcontext()
+        try:
+            return profiler.phase(f"modules.{obj.module.path}")
+        except ValueError:
+            return profiler.phase("objects")
 
     def _handle_object(self, obj: Object | Alias) -> None:
-        if obj.is_alias:
-            return
-        if obj.is_module or obj.is_class:
-            for member in obj.members.values():
-                self._handle_object(member)
-        elif obj.is_function:
-            self._handle_function(obj)  # type: ignore[arg-type]
-        elif obj.is_attribute:
-            self._handle_attribute(obj)  # type: ignore[arg-type]
+        # Objects are streamed module by module, then their sections are extracted,
+        # possibly in parallel, and finally merged into their docstrings in a deterministic order.
+        executor = ThreadPoolExecutor(max_workers=self._workers) if self._workers > 1 else None
+        try:
+            for module, members in self._batches(obj):
+                with self._context.profiler.phase(f"modules.{module.path}" if module is not None else "objects"):
+                    sections = dict(zip([member.path for member in members], self._extract(members, executor)))
+                    for member in members:
+                        self._merge(member, sections[member.path])
+                    if module is not None and self._disk_cache is not None:
+                        self._store_module(module, members, sections)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _batches(self, obj: Object | Alias) -> Iterator[tuple[Module | None, list[Attribute | Function]]]:
+        # Modules are walked with an explicit stack rather than recursively. Each batch holds the objects
+        # of one module (or of the given non-module object) in definition order. Submodules are processed
+        # after all the objects of their parent module, in definition order, not at their position among its members.
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if current.is_alias or self._excluded(current):
+                continue
+            if current.is_module and self._disk_cache is not None and self._restore_module(current):  # type: ignore[arg-type]
+                submodules = [member for member in current.members.values() if not member.is_alias and member.is_module]
+            else:
+                objects, submodules = self._gather_objects(current)
+                yield (current if current.is_module else None, objects)  # type: ignore[misc]
+            stack.extend(reversed(submodules))
+
+    def _gather_objects(self, obj: Object | Alias) -> tuple[list[Attribute | Function], list[Object | Alias]]:
+        objects: list[Attribute | Function] = []
+        submodules: list[Object | Alias] = []
+        stack = list(reversed(obj.members.values())) if obj.is_module else [obj]
+        while stack:
+            current = stack.pop()
+            if current.is_alias:
+                continue
+            if current.is_module:
+                submodules.append(current)
+            elif self._excluded(current):
+                continue
+            elif current.is_class:
+                stack.extend(reversed(current.members.values()))
+            elif (
+                (current.is_function or current.is_attribute)
+                and current not in self._handled
+                and self._selected(current)  # type: ignore[arg-type]
+            ):
+                self._handled.add(current)  # type: ignore[arg-type]
+                objects.append(current)  # type: ignore[arg-type]
+        return objects, submodules
+
+    def _store_module(
+        self,
+        module: Module,
+        members: list[Attribute | Function],
+        sections: dict[str, dict[str, Any]],
+    ) -> None:
+        # Objects without sections are not stored, but other modules can still give them some later.
+        dependencies = {dependency for member in members for dependency in static._dependencies(member)}
+        self._disk_cache.set(  # type: ignore[union-attr]
+            module,
+            {
+                path[len(module.path) + 1 :]: data
+                for path, obj_sections in sections.items()
+                if (data := _sections_as_dict(obj_sections))
+            },
+            dependencies=dependencies,
+        )
+
+    def _restore_module(self, module: Module) -> bool:
+        if (data := self._disk_cache.get(module)) is None:  # type: ignore[union-attr]
+            return False
+        # Entries are only returned when the module and its dependencies did not change, but members
+        # can still be missing, for example when other extensions remove them: extract the sections again.
+        try:
+            restored = [
+                (obj, _sections_from_dict(obj_data, obj))
+                for path, obj_data in data.items()
+                if (obj := module[path]) not in self._handled
+            ]
+        except KeyError:
+            return False
+        for obj, sections in restored:
+            self._handled.add(obj)
+            self._merge(obj, sections)
+        return True
 
     def on_package(
         self,
@@ -125,6 +511,11 @@ class TypingDocExtension(Extension):
     ) -> None:
         """Post-process Griffe packages recursively (non-yet handled objects only)."""
         self._handle_object(pkg)
+        self._context.clear()
+        if self._profile_output is not None:
+            self._context.profiler.dump(self._profile_output)
+        if self._index_output is not None:
+            _dump_index(self._index_entries, self._index_output)
 
     def on_function_instance(
         self,
@@ -141,10 +532,14 @@ class TypingDocExtension(Extension):
     ) -> None:
         """Post-process Griffe functions to add a parameters section.
 
-        It applies only for dynamic analysis.
+        It applies only for dynamic analysis, or for static analysis when `on_visit` is enabled.
         """
         if isinstance(node, ObjectNode):
-            self._handle_function(func, node=node)
+            with self._module_phase(func):
+                self._handle_function(func, node=node)
+        elif self._on_visit:
+            with self._module_phase(func):
+                self._visit_function(func)
 
     def on_attribute_instance(
         self,
@@ -161,7 +556,11 @@ class TypingDocExtension(Extension):
     ) -> None:
         """Post-process Griffe attributes to create their docstring.
 
-        It applies only for dynamic analysis.
+        It applies only for dynamic analysis, or for static analysis when `on_visit` is enabled.
         """
         if isinstance(node, ObjectNode):
-            self._handle_attribute(attr, node=node)
+            with self._module_phase(attr):
+                self._handle_attribute(attr, node=node)
+        elif self._on_visit:
+            with self._module_phase(attr):
+                self._visit_attribute(attr)
@@ -0,0 +1,100 @@
+# Standalone index of the extracted documentation, readable without Griffe.
+# The index is written by the extension: this module must not import Griffe.
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Annotated
+
+    from typing_extensions import Doc
+
+_index_version = 1
+
+# Columns of the index, in order. Items of sections are stored as lists of fields:
+# `[annotation, description]` for raises and warns, `[name, annotation, description]` for the others.
+_columns = (
+    "docstring",
+    "deprecated",
+    "parameters",
+    "other_parameters",
+    "raises",
+    "warns",
+    "yields",
+    "receives",
+    "returns",
+)
+
+
+class TypingDocIndex:
+    """Documentation extracted by the extension, indexed by object path.
+
+    The index is written by the extension when its `index_output` option is set.
+    It is a JSON file that can also be read without this package: a `version` number,
+    the sorted `paths` of documented objects, and `columns` mapping each kind of section
+    to a list aligned with `paths`, holding `null` for objects without such a section.
+    """
+
+    def __init__(
+        self,
+        paths: Annotated[list[str], Doc("Sorted paths of documented objects.")],
+        columns: Annotated[dict[str, list[Any]], Doc("Section data per kind, aligned with paths.")],
+    ) -> None:
+        self._paths = paths
+        self._columns = columns
+
+    @classmethod
+    def load(
+        cls,
+        path: Annotated[str | Path, Doc("Path to an index written by the extension.")],
+    ) -> Annotated[TypingDocIndex, Doc("The loaded index.")]:
+        """Load an index from a file.
+
+        Raises:
+            ValueError: When the index was written in an unsupported format.
+        """
+        data = json.loads(Path(path).read_bytes())
+        if data.get("version") != _index_version:
+            raise ValueError(f"Unsupported index version {data.get('version')!r}, expected {_index_version}")
+        return cls(data["paths"], data["columns"])
+
+    @property
+    def paths(self) -> Annotated[list[str], Doc("Sorted paths of documented objects.")]:
+        """Paths of the documented objects."""
+        return self._paths
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._position(path) is not None
+
+    def __getitem__(self, path: str) -> dict[str, Any]:
+        if (position := self._position(path)) is None:
+            raise KeyError(path)
+        return {kind: column[position] for kind, column in self._columns.items() if column[position] is not None}
+
+    def get(
+        self,
+        path: Annotated[str, Doc("Path of the object.")],
+        default: Annotated[Any, Doc("Value returned when the object is not documented.")] = None,
+    ) -> Annotated[dict[str, Any] | Any, Doc("Sections of the object, by kind.")]:
+        """Get the sections of an object."""
+        try:
+            return self[path]
+        except KeyError:
+            return default
+
+    def _position(self, path: str) -> int | None:
+        position = bisect_left(self._paths, path)
+        if position < len(self._paths) and self._paths[position] == path:
+            return position
+        return None
@@ -0,0 +1,54 @@
+# Opt-in instrumentation of the extraction phases.
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_disabled: AbstractContextManager[None] = nullcontext()
+
+
+class _Profiler:
+    """Cumulative time and call counts of named phases."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        """Whether phases are measured."""
+        self._timings: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        # Phases nest: the time of a phase includes the time of the phases it triggers.
+        if not self.enabled:
+            return _disabled
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                timing = self._timings.setdefault(name, [0, 0.0])
+                timing[0] += 1
+                timing[1] += elapsed
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {"calls": int(calls), "seconds": seconds}
+                for name, (calls, seconds) in sorted(self._timings.items())
+            }
+
+    def dump(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf8") as file:
+            json.dump(self.stats(), file, indent=2)
@@ -0,0 +1,80 @@
+# Compact records for the data extracted from annotations.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from griffe import Expr, ParameterKind
+
+
+class _Metadata:
+    """Record describing the metadata of an `Annotated` type."""
+
+    __slots__ = ("deprecated", "doc", "name", "raises", "warns")
+
+    def __init__(self) -> None:
+        self.doc: str | None = None
+        """Documentation string, from `Doc`."""
+        self.deprecated: str | None = None
+        """Deprecation message, from `deprecated`."""
+        self.name: str | None = None
+        """Name, from `Name`."""
+        self.raises: tuple[tuple[str | Expr, str], ...] = ()
+        """Raised exceptions and their descriptions, from `Raises`."""
+        self.warns: tuple[tuple[str | Expr, str], ...] = ()
+        """Emitted warnings and their descriptions, from `Warns`."""
+
+
+# Shared by every annotation without metadata: it must not be mutated.
+_no_metadata = _Metadata()
+
+# Shared by annotations referencing objects that are not known yet, and have no metadata for now.
+_unresolved_metadata = _Metadata()
+
+
+class _Item:
+    """Record describing a documented parameter, value or exception, before it becomes a section item."""
+
+    __slots__ = ("annotation", "description", "name", "value")
+
+    def __init__(
+        self,
+        annotation: str | Expr | None,
+        description: str,
+        name: str = "",
+        value: str | Expr | None = None,
+    ) -> None:
+        self.annotation = annotation
+        """Annotation of the item."""
+        self.description = description
+        """Description of the item."""
+        self.name = name
+        """Name of the item, if any."""
+        self.value = value
+        """Default value of the item, if any."""
+
+
+class _Parameter:
+    """Record describing a function parameter, shared by the section builders."""
+
+    __slots__ = ("annotation", "default", "kind", "name", "stars")
+
+    def __init__(
+        self,
+        name: str,
+        kind: ParameterKind | None,
+        stars: str,
+        annotation: str | Expr | None,
+        default: str | Expr | None,
+    ) -> None:
+        self.name = name
+        """Name of the parameter, without stars."""
+        self.kind = kind
+        """Kind of the parameter."""
+        self.stars = stars
+        """Star prefix of variadic parameters (`*` or `**`), empty otherwise."""
+        self.annotation = annotation
+        """Annotation of the parameter."""
+        self.default = default
+        """Default value of the parameter."""
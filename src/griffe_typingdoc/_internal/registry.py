@@ -0,0 +1,59 @@
+# Registry of the typing constructs understood by the extraction engines.
+
+from __future__ import annotations
+
+from typing import Any
+
+# Canonical paths of supported objects, mapped to the kind of construct they represent.
+# Both the static and dynamic engines dispatch on these kinds, along with the aliases of each extension.
+_kinds: dict[str, str] = {
+    "typing.Annotated": "Annotated",
+    "typing_extensions.Annotated": "Annotated",
+    "typing.Doc": "Doc",
+    "typing_extensions.Doc": "Doc",
+    "typing.deprecated": "deprecated",
+    "typing_extensions.deprecated": "deprecated",
+    "warnings.deprecated": "deprecated",
+    "typing.Name": "Name",
+    "typing_extensions.Name": "Name",
+    "typing.Raises": "Raises",
+    "typing_extensions.Raises": "Raises",
+    "typing.Warns": "Warns",
+    "typing_extensions.Warns": "Warns",
+    "typing.Unpack": "Unpack",
+    "typing_extensions.Unpack": "Unpack",
+    "typing.Generator": "Generator",
+    "typing_extensions.Generator": "Generator",
+    "collections.abc.Generator": "Generator",
+    "typing.Iterator": "Iterator",
+    "typing_extensions.Iterator": "Iterator",
+    "collections.abc.Iterator": "Iterator",
+    "typing.Required": "Required",
+    "typing_extensions.Required": "Required",
+    "typing.NotRequired": "NotRequired",
+    "typing_extensions.NotRequired": "NotRequired",
+    "typing.ReadOnly": "ReadOnly",
+    "typing_extensions.ReadOnly": "ReadOnly",
+    "typing.TypedDict": "TypedDict",
+    "typing_extensions.TypedDict": "TypedDict",
+}
+
+
+def _kind(path: str, kinds: dict[str, str]) -> str | None:
+    return kinds.get(path)
+
+
+def _runtime_kind(obj: Any, kinds: dict[str, str]) -> str | None:
+    cls = type(obj)
+    return kinds.get(f"{cls.__module__}.{cls.__qualname__}")
+
+
+def _aliased_kinds(aliases: dict[str, str]) -> dict[str, str]:
+    # Aliases are added to a copy of the registry, so that they only apply to the extension declaring them.
+    kinds = dict(_kinds)
+    for alias, target in aliases.items():
+        try:
+            kinds[alias] = _kinds[target]
+        except KeyError as error:
+            raise ValueError(f"Cannot alias '{alias}' to unsupported object '{target}'") from error
+    return kinds
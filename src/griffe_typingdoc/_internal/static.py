@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import builtins
 import inspect
 from ast import literal_eval
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
-from griffe import Expr, ExprCall, ExprSubscript, ExprTuple, ParameterKind
+from griffe import (
+    AliasResolutionError,
+    CyclicAliasError,
+    Expr,
+    ExprAttribute,
+    ExprCall,
+    ExprName,
+    ExprSubscript,
+    ExprTuple,
+    ParameterKind,
+)
 
 from griffe_typingdoc._internal.docstrings import (
-    _no_self_params,
+    _parameters,
     _to_deprecated_section,
     _to_other_parameters_section,
     _to_parameters_section,
@@ -20,13 +30,17 @@ from griffe_typingdoc._internal.docstrings import (
     _to_warns_section,
     _to_yields_section,
 )
+from griffe_typingdoc._internal.records import _Item, _Metadata, _no_metadata, _Parameter, _unresolved_metadata
+from griffe_typingdoc._internal.registry import _kind
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from griffe import (
         Attribute,
+        Class,
         DocstringSectionAdmonition,
+        DocstringSectionOtherParameters,
         DocstringSectionParameters,
         DocstringSectionRaises,
         DocstringSectionReceives,
@@ -34,123 +48,344 @@ if TYPE_CHECKING:
         DocstringSectionWarns,
         DocstringSectionYields,
         Function,
+        Module,
     )
 
+    from griffe_typingdoc._internal.context import _Context
+
+
+def _string_value(source: str) -> str:
+    # Griffe stores string constants as their `repr`: when the delimiters are unambiguous,
+    # only escape sequences must be decoded, which avoids parsing the string again.
+    quote = source[:1]
+    inner = source[1:-1]
+    if quote in {"'", '"'} and len(source) > 1 and source[-1] == quote and quote not in inner:
+        if "\\" not in inner:
+            return inner
+        return inner.encode("latin-1", "backslashreplace").decode("unicode_escape")
+    return literal_eval(source)
 
-def _literal(value: str | Expr) -> str:
-    return inspect.cleandoc(literal_eval(str(value)))
 
+def _literal(value: str | Expr, context: _Context) -> str:
+    if not isinstance(value, str):
+        return inspect.cleandoc(literal_eval(str(value)))
+    docstring = context.literal_cache.get(value)
+    if docstring is None:
+        docstring = inspect.cleandoc(_string_value(value))
+        context.literal_cache.set(value, docstring)
+    return docstring
 
-def _set_metadata_doc(metadata: dict[str, Any], data: ExprCall) -> None:
-    metadata["doc"] = _literal(data.arguments[0])
 
+def _set_metadata_doc(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    metadata.doc = _literal(data.arguments[0], context)
 
-def _set_metadata_deprecated(metadata: dict[str, Any], data: ExprCall) -> None:
-    metadata["deprecated"] = _literal(data.arguments[0])
 
+def _set_metadata_deprecated(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    metadata.deprecated = _literal(data.arguments[0], context)
 
-def _set_metadata_name(metadata: dict[str, Any], data: ExprCall) -> None:
-    metadata["name"] = _literal(data.arguments[0])
 
+def _set_metadata_name(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    metadata.name = _literal(data.arguments[0], context)
 
-def _set_metadata_raises(metadata: dict[str, Any], data: ExprCall) -> None:
-    metadata["raises"].append((data.arguments[0], _literal(data.arguments[1])))
 
+def _set_metadata_raises(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    metadata.raises += ((data.arguments[0], _literal(data.arguments[1], context)),)
 
-def _set_metadata_warns(metadata: dict[str, Any], data: ExprCall) -> None:
-    metadata["warns"].append((data.arguments[0], _literal(data.arguments[1])))
+
+def _set_metadata_warns(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    metadata.warns += ((data.arguments[0], _literal(data.arguments[1], context)),)
 
 
 _set_metadata_map = {
-    "typing.Doc": _set_metadata_doc,
-    "typing_extensions.Doc": _set_metadata_doc,
-    "typing.deprecated": _set_metadata_deprecated,
-    "typing_extensions.deprecated": _set_metadata_deprecated,
-    "typing.Name": _set_metadata_name,
-    "typing_extensions.Name": _set_metadata_name,
-    "typing.Raises": _set_metadata_raises,
-    "typing_extensions.Raises": _set_metadata_raises,
-    "typing.Warns": _set_metadata_warns,
-    "typing_extensions.Warns": _set_metadata_warns,
+    "Doc": _set_metadata_doc,
+    "deprecated": _set_metadata_deprecated,
+    "Name": _set_metadata_name,
+    "Raises": _set_metadata_raises,
+    "Warns": _set_metadata_warns,
 }
 
 
-def _set_metadata(metadata: dict[str, Any], data: ExprCall) -> None:
-    if data.function.canonical_path in _set_metadata_map:
-        _set_metadata_map[data.function.canonical_path](metadata, data)
+def _set_metadata(metadata: _Metadata, data: ExprCall, context: _Context) -> None:
+    if (set_metadata := _set_metadata_map.get(_kind(data.function.canonical_path, context.kinds) or "")) is not None:
+        set_metadata(metadata, data, context)
+
+
+def _metadata_key(annotation: Expr) -> tuple[str, str]:
+    # Identical annotations written in the same scope resolve to the same objects,
+    # so their source and the path of the scope identify their metadata.
+    for element in annotation.iterate(flat=True):
+        if isinstance(element, ExprName) and not isinstance(element.parent, (str, ExprName)):
+            return (element.parent.path if element.parent else "", str(annotation))
+    return ("", str(annotation))
+
+
+def _metadata(annotation: str | Expr | None, context: _Context) -> _Metadata:
+    # Returned records can be shared between annotations: they must not be mutated.
+    if isinstance(annotation, (ExprName, ExprAttribute)):
+        return _alias_metadata(annotation, context)
+    if not isinstance(annotation, ExprSubscript):
+        return _no_metadata
+    with context.profiler.phase("metadata"):
+        key = _metadata_key(annotation)
+        metadata = context.metadata_cache.get(key)
+        if metadata is None:
+            metadata = _annotated_metadata(annotation, context)
+            context.metadata_cache.set(key, metadata)
+        return metadata
+
+
+_builtin_names = frozenset(vars(builtins))
+
+
+def _alias_metadata(annotation: ExprName | ExprAttribute, context: _Context) -> _Metadata:
+    # Aliases such as `UserId = Annotated[int, Doc("...")]` are resolved once for all the annotations using them.
+    path = annotation.canonical_path
+    if "." not in path:
+        # Other names are not defined yet, for example aliases defined later in the module.
+        return _no_metadata if path in _builtin_names else _unresolved_metadata
+    metadata = context.alias_cache.get(path)
+    if metadata is None:
+        scope = annotation.last if isinstance(annotation, ExprAttribute) else annotation
+        while isinstance(scope, ExprName):
+            scope = scope.parent  # type: ignore[assignment]
+        if scope is None or isinstance(scope, (str, Expr)):
+            return _no_metadata
+        try:
+            alias = scope.modules_collection[path]
+            value = alias.value if alias.is_attribute or alias.is_type_alias else None
+        except (KeyError, AliasResolutionError, CyclicAliasError):
+            # Objects of packages that are not loaded, for example `pathlib.Path`, will not be found
+            # until caches are cleared: remember them. Other objects can still be loaded later.
+            top = path.split(".", 1)[0]
+            if top not in scope.modules_collection and top != scope.package.name:
+                context.alias_cache.set(path, _no_metadata)
+                return _no_metadata
+            return _unresolved_metadata
+        with context.profiler.phase("metadata"):
+            metadata = _annotated_metadata(value, context) if isinstance(value, ExprSubscript) else _no_metadata
+        context.alias_cache.set(path, metadata)
+    return metadata
 
 
-def _metadata(annotation: str | Expr | None) -> dict[str, Any]:
-    metadata: dict[str, Any] = {"raises": [], "warns": []}
-    if isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-        "typing.Annotated",
-        "typing_extensions.Annotated",
-    }:
-        annotated_data: Sequence[str | Expr]
-        if isinstance(annotation.slice, ExprTuple):
-            annotation, *annotated_data = annotation.slice.elements
-        else:
-            annotation = annotation.slice
-            annotated_data = ()
-        for data in annotated_data:
-            if isinstance(data, ExprCall):
-                _set_metadata(metadata, data)
+def _annotated_metadata(annotation: ExprSubscript, context: _Context) -> _Metadata:
+    if _kind(annotation.canonical_path, context.kinds) != "Annotated" or not isinstance(annotation.slice, ExprTuple):
+        return _no_metadata
+    metadata = _Metadata()
+    for data in annotation.slice.elements[1:]:
+        if isinstance(data, ExprCall):
+            _set_metadata(metadata, data, context)
     return metadata
 
 
-def _attribute_docs(attr: Attribute, **kwargs: Any) -> str:  # noqa: ARG001
-    return _metadata(attr.annotation).get("doc", "")
+# Kinds of the top-level annotations from which sections are built: other objects can be skipped early.
+_documented_kinds = {"Annotated", "Unpack", "Generator", "Iterator"}
+
+
+def _documented(annotation: str | Expr | None, context: _Context) -> bool:
+    if isinstance(annotation, (ExprName, ExprAttribute)):
+        return _alias_metadata(annotation, context) not in (_no_metadata, _unresolved_metadata)
+    return (
+        isinstance(annotation, ExprSubscript) and _kind(annotation.canonical_path, context.kinds) in _documented_kinds
+    )
+
+
+def _annotated(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    parameters: Sequence[_Parameter] | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> bool:
+    if attr_or_func.is_function:
+        if parameters is None:
+            parameters = _parameters(attr_or_func)  # type: ignore[arg-type]
+        return _documented(attr_or_func.returns, context) or any(  # type: ignore[union-attr]
+            _documented(parameter.annotation, context) for parameter in parameters
+        )
+    return _documented(attr_or_func.annotation, context)
+
+
+def _unresolved(
+    attr_or_func: Attribute | Function,
+    context: _Context,
+    parameters: Sequence[_Parameter] | None = None,
+) -> bool:
+    # Names can refer to objects of modules that are not loaded yet, or defined later in the same module.
+    if attr_or_func.is_function:
+        if parameters is None:
+            parameters = _parameters(attr_or_func)  # type: ignore[arg-type]
+        annotations = [attr_or_func.returns, *(parameter.annotation for parameter in parameters)]  # type: ignore[union-attr]
+    else:
+        annotations = [attr_or_func.annotation]
+    for annotation in annotations:
+        if not isinstance(annotation, Expr):
+            continue
+        elements = list(annotation.iterate(flat=True))
+        for element, following in zip(elements, [*elements[1:], None]):
+            # In attribute chains such as `typing.Annotated`, only the last name refers to an object that can be missing:
+            # previous names are modules or classes, and their paths are not dotted.
+            if (
+                isinstance(element, ExprName)
+                and following != "."
+                and _alias_metadata(element, context) is _unresolved_metadata
+            ):
+                return True
+    return False
+
+
+def _dependencies(
+    attr_or_func: Attribute | Function,
+    parameters: Sequence[_Parameter] | None = None,
+) -> set[Module]:
+    # Modules defining the objects that annotations refer to, directly or through aliases, typed dicts and their bases:
+    # changing them can change the sections extracted from the object.
+    if attr_or_func.is_function:
+        if parameters is None:
+            parameters = _parameters(attr_or_func)  # type: ignore[arg-type]
+        annotations = [attr_or_func.returns, *(parameter.annotation for parameter in parameters)]  # type: ignore[union-attr]
+    else:
+        annotations = [attr_or_func.annotation]
+    modules: set[Module] = set()
+    seen: set[str] = set()
+    stack: list[str | Expr | None] = list(annotations)
+    while stack:
+        if not isinstance(expression := stack.pop(), Expr):
+            continue
+        for element in expression.iterate(flat=True):
+            if not isinstance(element, ExprName) or "." not in (path := element.canonical_path) or path in seen:
+                continue
+            seen.add(path)
+            try:
+                obj = attr_or_func.modules_collection[path]
+                # Modules re-exporting the object decide what it resolves to.
+                hops = set()
+                while obj.is_alias and obj.path not in hops:
+                    hops.add(obj.path)
+                    modules.add(obj.parent.module)
+                    obj = obj.target
+            except (KeyError, AliasResolutionError, CyclicAliasError):
+                continue
+            if obj.is_alias:
+                continue
+            modules.add(obj.module)
+            if obj.is_attribute or obj.is_type_alias:
+                stack.append(obj.value)
+            elif obj.is_class:
+                stack.extend(obj.bases)
+                stack.extend(member.annotation for member in obj.members.values() if member.is_attribute)
+    return modules
+
+
+def _attribute_docs(
+    attr: Attribute,
+    *,
+    context: _Context,
+    metadata: _Metadata | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> str:
+    if metadata is None:
+        metadata = _metadata(attr.annotation, context)
+    return metadata.doc or ""
 
 
-def _parameters_docs(func: Function, **kwargs: Any) -> DocstringSectionParameters | None:  # noqa: ARG001
-    params_data: dict[str, dict[str, Any]] = defaultdict(dict)
-    for parameter in _no_self_params(func):
-        stars = {ParameterKind.var_positional: "*", ParameterKind.var_keyword: "**"}.get(parameter.kind, "")  # type: ignore[arg-type]
-        param_name = f"{stars}{parameter.name}"
-        metadata = _metadata(parameter.annotation)
-        if "deprecated" in metadata or "doc" in metadata:
-            description = f"{metadata.get('deprecated', '')} {metadata.get('doc', '')}".lstrip()
-            params_data[param_name]["description"] = description
-            params_data[param_name]["annotation"] = parameter.annotation
+def _parameters_docs(
+    func: Function,
+    *,
+    context: _Context,
+    parameters: Sequence[_Parameter] | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> DocstringSectionParameters | None:
+    params_data: list[_Item] = []
+    for parameter in _parameters(func) if parameters is None else parameters:
+        metadata = _metadata(parameter.annotation, context)
+        if metadata.deprecated is not None or metadata.doc is not None:
+            description = f"{metadata.deprecated or ''} {metadata.doc or ''}".lstrip()
+            params_data.append(
+                _Item(parameter.annotation, description, f"{parameter.stars}{parameter.name}", parameter.default),
+            )
     if params_data:
-        return _to_parameters_section(params_data, func)
+        return _to_parameters_section(params_data)
     return None
 
 
-def _other_parameters_docs(func: Function, **kwargs: Any) -> DocstringSectionParameters | None:  # noqa: ARG001
-    for parameter in func.parameters:
-        if parameter.kind is ParameterKind.var_keyword:
-            annotation = parameter.annotation
-            if isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-                "typing.Annotated",
-                "typing_extensions.Annotated",
-            }:
-                annotation = annotation.slice.elements[0]  # type: ignore[union-attr]
-            if isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-                "typing.Unpack",
-                "typing_extensions.Unpack",
-            }:
-                slice_path = annotation.slice.canonical_path  # type: ignore[union-attr]
-                typed_dict = func.modules_collection[slice_path]
-                params_data = {
-                    attr.name: {"annotation": attr.annotation, "description": description}
-                    for attr in typed_dict.members.values()
-                    if (description := _metadata(attr.annotation).get("doc")) is not None
-                }
-                if params_data:
-                    return _to_other_parameters_section(params_data)
-            break
+def _typed_dict_docs(typed_dict: Class, context: _Context) -> dict[str, _Item]:
+    cached = context.typed_dict_cache.get(typed_dict.path)
+    if cached is None:
+        params_data: dict[str, _Item] = {}
+        for base in typed_dict.bases:
+            base_path = base.canonical_path if isinstance(base, Expr) else base
+            if _kind(base_path, context.kinds) == "TypedDict":
+                continue
+            try:
+                base_class = typed_dict.modules_collection[base_path]
+            except KeyError:
+                continue
+            if base_class.is_class:
+                params_data.update(_typed_dict_docs(base_class, context))
+        params_data.update(
+            {
+                attr.name: _Item(attr.annotation, description, attr.name)  # type: ignore[union-attr]
+                for attr in typed_dict.members.values()
+                if (description := _metadata(attr.annotation, context).doc) is not None  # type: ignore[union-attr]
+            },
+        )
+        cached = params_data
+        context.typed_dict_cache.set(typed_dict.path, cached)
+    return cached
+
+
+def _unpacked_typed_dict(
+    func: Function,
+    context: _Context,
+    parameters: Sequence[_Parameter] | None = None,
+) -> str | None:
+    if parameters is None:
+        parameters = _parameters(func)
+    # Variadic keyword parameters are always last.
+    if parameters and parameters[-1].kind is ParameterKind.var_keyword:
+        annotation = parameters[-1].annotation
+        if isinstance(annotation, ExprSubscript) and _kind(annotation.canonical_path, context.kinds) == "Annotated":
+            annotation = annotation.slice.elements[0]  # type: ignore[union-attr]
+        if isinstance(annotation, ExprSubscript) and _kind(annotation.canonical_path, context.kinds) == "Unpack":
+            return annotation.slice.canonical_path  # type: ignore[union-attr]
     return None
 
 
-def _yields_docs(func: Function, **kwargs: Any) -> DocstringSectionYields | None:  # noqa: ARG001
+def _other_parameters_docs(
+    func: Function,
+    *,
+    context: _Context,
+    parameters: Sequence[_Parameter] | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> DocstringSectionOtherParameters | None:
+    if (typed_dict_path := _unpacked_typed_dict(func, context, parameters)) is None:
+        return None
+    try:
+        typed_dict = func.modules_collection[typed_dict_path]
+    except KeyError:
+        return None
+    if params_data := _typed_dict_docs(typed_dict, context):
+        return _to_other_parameters_section(params_data.values())
+    return None
+
+
+def _slice_element(annotation: ExprSubscript, index: int) -> str | Expr | None:
+    # Generators may be subscripted with fewer arguments than we read, for example `Generator[int]`.
+    if isinstance(annotation.slice, ExprTuple):
+        elements = annotation.slice.elements
+        return elements[index] if len(elements) > index else None
+    return annotation.slice if index == 0 else None
+
+
+def _yields_docs(func: Function, *, context: _Context, **kwargs: Any) -> DocstringSectionYields | None:  # noqa: ARG001
     yield_annotation = None
     annotation = func.returns
 
     if isinstance(annotation, ExprSubscript):
-        if annotation.canonical_path in {"typing.Generator", "typing_extensions.Generator"}:
-            yield_annotation = annotation.slice.elements[0]  # type: ignore[union-attr]
-        elif annotation.canonical_path in {"typing.Iterator", "typing_extensions.Iterator"}:
+        kind = _kind(annotation.canonical_path, context.kinds)
+        if kind == "Generator":
+            yield_annotation = _slice_element(annotation, 0)
+        elif kind == "Iterator":
             yield_annotation = annotation.slice
 
     if yield_annotation:
@@ -159,9 +394,9 @@ def _yields_docs(func: Function, **kwargs: Any) -> DocstringSectionYields | None
         else:
             yield_elements = [yield_annotation]
         yield_data = [
-            {"annotation": element, **metadata}
+            _Item(element, metadata.doc, metadata.name or "")
             for element in yield_elements
-            if "doc" in (metadata := _metadata(element))
+            if (metadata := _metadata(element, context)).doc is not None
         ]
         if yield_data:
             return _to_yields_section(yield_data)
@@ -169,15 +404,12 @@ def _yields_docs(func: Function, **kwargs: Any) -> DocstringSectionYields | None
     return None
 
 
-def _receives_docs(func: Function, **kwargs: Any) -> DocstringSectionReceives | None:  # noqa: ARG001
+def _receives_docs(func: Function, *, context: _Context, **kwargs: Any) -> DocstringSectionReceives | None:  # noqa: ARG001
     receive_annotation = None
     annotation = func.returns
 
-    if isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-        "typing.Generator",
-        "typing_extensions.Generator",
-    }:
-        receive_annotation = annotation.slice.elements[1]  # type: ignore[union-attr]
+    if isinstance(annotation, ExprSubscript) and _kind(annotation.canonical_path, context.kinds) == "Generator":
+        receive_annotation = _slice_element(annotation, 1)
 
     if receive_annotation:
         if isinstance(receive_annotation, ExprSubscript) and receive_annotation.is_tuple:
@@ -185,9 +417,9 @@ def _receives_docs(func: Function, **kwargs: Any) -> DocstringSectionReceives |
         else:
             receive_elements = [receive_annotation]
         receive_data = [
-            {"annotation": element, **metadata}
+            _Item(element, metadata.doc, metadata.name or "")
             for element in receive_elements
-            if "doc" in (metadata := _metadata(element))
+            if (metadata := _metadata(element, context)).doc is not None
         ]
         if receive_data:
             return _to_receives_section(receive_data)
@@ -195,19 +427,23 @@ def _receives_docs(func: Function, **kwargs: Any) -> DocstringSectionReceives |
     return None
 
 
-def _returns_docs(func: Function, **kwargs: Any) -> DocstringSectionReturns | None:  # noqa: ARG001
+def _returns_docs(
+    func: Function,
+    *,
+    context: _Context,
+    metadata: _Metadata | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> DocstringSectionReturns | None:
     return_annotation = None
     annotation = func.returns
 
-    if isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-        "typing.Generator",
-        "typing_extensions.Generator",
-    }:
-        return_annotation = annotation.slice.elements[2]  # type: ignore[union-attr]
-    elif isinstance(annotation, ExprSubscript) and annotation.canonical_path in {
-        "typing.Annotated",
-        "typing_extensions.Annotated",
-    }:
+    if isinstance(annotation, ExprSubscript):
+        kind = _kind(annotation.canonical_path, context.kinds)
+        if kind == "Generator":
+            return_annotation = _slice_element(annotation, 2)
+        elif kind == "Annotated":
+            return_annotation = annotation
+    elif isinstance(annotation, (ExprName, ExprAttribute)):
         return_annotation = annotation
 
     if return_annotation:
@@ -215,10 +451,12 @@ def _returns_docs(func: Function, **kwargs: Any) -> DocstringSectionReturns | No
             return_elements = return_annotation.slice.elements  # type: ignore[union-attr]
         else:
             return_elements = [return_annotation]
+        # The return annotation itself was already parsed by the caller, reuse its metadata.
+        known = {id(annotation): metadata} if metadata is not None else {}
         return_data = [
-            {"annotation": element, **metadata}
+            _Item(element, element_metadata.doc, element_metadata.name or "")
             for element in return_elements
-            if "doc" in (metadata := _metadata(element))
+            if (element_metadata := known.get(id(element)) or _metadata(element, context)).doc is not None
         ]
         if return_data:
             return _to_returns_section(return_data)
@@ -226,43 +464,56 @@ def _returns_docs(func: Function, **kwargs: Any) -> DocstringSectionReturns | No
     return None
 
 
-def _warns_docs(attr_or_func: Attribute | Function, **kwargs: Any) -> DocstringSectionWarns | None:  # noqa: ARG001
+def _annotation_metadata(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    **kwargs: Any,  # noqa: ARG001
+) -> _Metadata:
     if attr_or_func.is_attribute:
-        annotation = attr_or_func.annotation
-    elif attr_or_func.is_function:
-        annotation = attr_or_func.returns  # type: ignore[union-attr]
-    else:
-        return None
-    metadata = _metadata(annotation)
-    if metadata["warns"]:
-        return _to_warns_section({"annotation": warned[0], "description": warned[1]} for warned in metadata["warns"])
+        return _metadata(attr_or_func.annotation, context)
+    if attr_or_func.is_function:
+        return _metadata(attr_or_func.returns, context)  # type: ignore[union-attr]
+    return _no_metadata
+
+
+def _warns_docs(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    metadata: _Metadata | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> DocstringSectionWarns | None:
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context)
+    if metadata.warns:
+        return _to_warns_section(_Item(*warned) for warned in metadata.warns)
     return None
 
 
-def _raises_docs(attr_or_func: Attribute | Function, **kwargs: Any) -> DocstringSectionRaises | None:  # noqa: ARG001
-    if attr_or_func.is_attribute:
-        annotation = attr_or_func.annotation
-    elif attr_or_func.is_function:
-        annotation = attr_or_func.returns  # type: ignore[union-attr]
-    else:
-        return None
-    metadata = _metadata(annotation)
-    if metadata["raises"]:
-        return _to_raises_section({"annotation": raised[0], "description": raised[1]} for raised in metadata["raises"])
+def _raises_docs(
+    attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    metadata: _Metadata | None = None,
+    **kwargs: Any,  # noqa: ARG001
+) -> DocstringSectionRaises | None:
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context)
+    if metadata.raises:
+        return _to_raises_section(_Item(*raised) for raised in metadata.raises)
     return None
 
 
 def _deprecated_docs(
     attr_or_func: Attribute | Function,
+    *,
+    context: _Context,
+    metadata: _Metadata | None = None,
     **kwargs: Any,  # noqa: ARG001
 ) -> DocstringSectionAdmonition | None:
-    if attr_or_func.is_attribute:
-        annotation = attr_or_func.annotation
-    elif attr_or_func.is_function:
-        annotation = attr_or_func.returns  # type: ignore[union-attr]
-    else:
-        return None
-    metadata = _metadata(annotation)
-    if "deprecated" in metadata:
-        return _to_deprecated_section({"description": metadata["deprecated"]})
+    if metadata is None:
+        metadata = _annotation_metadata(attr_or_func, context=context)
+    if metadata.deprecated is not None:
+        return _to_deprecated_section(metadata.deprecated)
     return None
@@ -0,0 +1,86 @@
+"""Tests for the CLI."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from griffe import temporary_pypackage
+
+from griffe_typingdoc import TypingDocIndex, main
+from griffe_typingdoc._internal import debug
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Load a package, dump its sections and report statistics."""
+    code = """
+        from typing_extensions import Annotated, Doc
+
+        def f(a: Annotated[str, Doc("Hello.")]) -> None: ...
+    """
+    with temporary_pypackage("cli_package", {"__init__.py": code}) as package:
+        index_path = tmp_path / "index.json"
+        report_path = tmp_path / "report.json"
+        args = ["cli_package", "-s", str(package.tmpdir), "-o", str(index_path), "-r", str(report_path)]
+        assert main(args) == 0
+
+    captured = capsys.readouterr()
+    assert "cli_package: 1 objects in" in captured.err
+    assert "objects/s" in captured.err
+    assert "metadata:" in captured.err
+
+    assert TypingDocIndex.load(index_path)["cli_package.f"]["parameters"] == [["a", "str", "Hello."]]
+    report = json.loads(report_path.read_text())
+    assert report["packages"]["cli_package"]["objects"] == 1
+    assert "cli_package" in report["modules"]
+    assert report["caches"]["metadata"]["misses"] > 0
+
+
+def test_exit_code_on_errors(capsys: pytest.CaptureFixture) -> None:
+    """Report packages that cannot be loaded and exit with a non-zero code."""
+    assert main(["griffe_typingdoc", "griffe_typingdoc_unknown_package"]) == 1
+    captured = capsys.readouterr()
+    assert "griffe_typingdoc: " in captured.err
+    assert "griffe_typingdoc_unknown_package: error: " in captured.err
+
+
+def test_show_help(capsys: pytest.CaptureFixture) -> None:
+    """Show help.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    with pytest.raises(SystemExit):
+        main(["-h"])
+    captured = capsys.readouterr()
+    assert "griffe-typingdoc" in captured.out
+
+
+def test_show_version(capsys: pytest.CaptureFixture) -> None:
+    """Show version.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    with pytest.raises(SystemExit):
+        main(["-V"])
+    captured = capsys.readouterr()
+    assert debug._get_version() in captured.out
+
+
+def test_show_debug_info(capsys: pytest.CaptureFixture) -> None:
+    """Show debug information.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    with pytest.raises(SystemExit):
+        main(["--debug-info"])
+    captured = capsys.readouterr().out.lower()
+    assert "python" in captured
+    assert "system" in captured
+    assert "environment" in captured
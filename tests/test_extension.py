@@ -1,9 +1,31 @@
 """Tests for the Griffe extension."""
 
+from __future__ import annotations
+
+import gc
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
+
 import pytest
-from griffe import DocstringSectionKind, Extensions, GriffeLoader, temporary_visited_package
+from griffe import (
+    Docstring,
+    DocstringSectionKind,
+    Extension,
+    Extensions,
+    Function,
+    GriffeLoader,
+    JSONEncoder,
+    temporary_inspected_package,
+    temporary_pypackage,
+    temporary_visited_package,
+)
 
-from griffe_typingdoc import TypingDocExtension
+from griffe_typingdoc import TypingDocExtension, TypingDocIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 typing_imports = (
     "from typing import Annotated, Doc, Generator, Iterator, Name, NotRequired, Raises, TypedDict, Unpack, Warns"
@@ -298,3 +320,867 @@ def test_ignore_unannotated_receives(annotation: str) -> None:
         sections = package["f"].docstring.parsed
         assert len(sections) == 1
         assert sections[0].kind is DocstringSectionKind.text
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        "typing.Iterator",
+        "typing.Generator",
+        "collections.abc.Iterator",
+        "collections.abc.Generator",
+        "collections.abc.Generator[int]",
+        "collections.abc.Generator[int, None]",
+    ],
+)
+@pytest.mark.parametrize("temporary_package", [temporary_visited_package, temporary_inspected_package])
+def test_ignore_bare_and_partial_generators(annotation: str, temporary_package: Any) -> None:
+    """Ignore generators and iterators missing type arguments."""
+    with temporary_package(
+        "package",
+        {
+            "__init__.py": f"import collections.abc\nimport typing\ndef f() -> {annotation}:\n    '''Docstring.'''",
+        },
+        extensions=Extensions(TypingDocExtension()),
+    ) as package:
+        sections = package["f"].docstring.parsed
+        assert len(sections) == 1
+        assert sections[0].kind is DocstringSectionKind.text
+
+
+@pytest.mark.parametrize("temporary_package", [temporary_visited_package, temporary_inspected_package])
+def test_partial_generator_yields(temporary_package: Any) -> None:
+    """Read yields from generators subscripted with their yield type only."""
+    with temporary_package(
+        "package",
+        {
+            "__init__.py": """
+                import collections.abc
+                from typing_extensions import Annotated, Doc
+
+                def f() -> collections.abc.Generator[Annotated[int, Doc("Yielded.")]]:
+                    '''Docstring.'''
+            """,
+        },
+        extensions=Extensions(TypingDocExtension()),
+    ) as package:
+        sections = package["f"].docstring.parsed
+        assert sections[1].kind is DocstringSectionKind.yields
+        assert [item.description for item in sections[1].value] == ["Yielded."]
+
+
+def test_deprecated_raises_warns_from_return_annotation() -> None:
+    """Read deprecation, raises and warns metadata from the return annotation."""
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                from typing_extensions import deprecated
+                def f() -> Annotated[
+                    int,
+                    Doc("Returned hello."),
+                    deprecated("Deprecated since v2."),
+                    Raises(ValueError, "When hello."),
+                    Warns(UserWarning, "When world."),
+                ]:
+                    '''Docstring.'''
+            """,
+        },
+        extensions=Extensions(TypingDocExtension()),
+    ) as package:
+        sections = package["f"].docstring.parsed
+        assert [section.kind for section in sections] == [
+            DocstringSectionKind.admonition,
+            DocstringSectionKind.text,
+            DocstringSectionKind.raises,
+            DocstringSectionKind.warns,
+            DocstringSectionKind.returns,
+        ]
+        assert sections[0].title == "Deprecated since v2."
+        assert sections[2].value[0].description == "When hello."
+        assert sections[3].value[0].description == "When world."
+        assert sections[4].value[0].description == "Returned hello."
+
+
+def test_metadata_cache_reuses_identical_annotations() -> None:
+    """Parse identical annotations only once per scope."""
+    extension = TypingDocExtension()
+    before = extension.cache_stats["metadata"]
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                def f(a: Annotated[str, Doc("Hello.")]): ...
+                def g(b: Annotated[str, Doc("Hello.")]): ...
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        assert package["f"].docstring.parsed[1].value[0].description == "Hello."
+        assert package["g"].docstring.parsed[1].value[0].description == "Hello."
+    after = extension.cache_stats["metadata"]
+    assert after["hits"] > before["hits"]  # type: ignore[operator]
+
+
+def test_metadata_cache_eviction() -> None:
+    """Evict least recently used entries when the cache is full."""
+    extension = TypingDocExtension(cache_size=1)
+    before = extension.cache_stats["metadata"]
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                def f(a: Annotated[str, Doc("Hello.")], b: Annotated[int, Doc("World.")]): ...
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        assert [param.description for param in package["f"].docstring.parsed[1].value] == ["Hello.", "World."]
+    after = extension.cache_stats["metadata"]
+    assert after["maxsize"] == 1
+    assert after["evictions"] > before["evictions"]  # type: ignore[operator]
+    # Caches belong to each extension: other extensions do not resize them.
+    other = TypingDocExtension(cache_size=0)
+    assert extension.cache_stats["metadata"]["maxsize"] == 1
+    assert other.cache_stats["metadata"]["maxsize"] == 0
+
+
+def test_dynamic_attribute_docs_resolve_parent_hints_once() -> None:
+    """Resolve type hints of a class once for all its attributes."""
+    extension = TypingDocExtension()
+    before = extension.cache_stats["type_hints"]
+    with temporary_inspected_package(
+        "package",
+        {
+            "__init__.py": """
+                from typing_extensions import Annotated, Doc
+
+                class Value: ...
+
+                class A:
+                    a: Annotated[Value, Doc("A.")] = Value()
+                    b: Annotated[Value, Doc("B.")] = Value()
+                    c: Annotated[Value, Doc("C.")] = Value()
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        assert [package[f"A.{name}"].docstring.value for name in "abc"] == ["A.", "B.", "C."]
+    after = extension.cache_stats["type_hints"]
+    assert after["hits"] - before["hits"] >= 2  # type: ignore[operator]
+
+
+def test_registered_aliases() -> None:
+    """Support in-house re-exports of typing objects."""
+    modules = {
+        "__init__.py": """
+            from typing_extensions import Annotated
+            from package._typing import Doc
+
+            def f(a: Annotated[str, Doc("Hello.")]): ...
+        """,
+        "_typing.py": "from typing_extensions import Doc",
+    }
+    with temporary_visited_package("package", modules, extensions=Extensions(TypingDocExtension())) as package:
+        assert not package["f"].docstring
+    extension = TypingDocExtension(aliases={"package._typing.Doc": "typing_extensions.Doc"})
+    with temporary_visited_package("package", modules, extensions=Extensions(extension)) as package:
+        assert package["f"].docstring.parsed[1].value[0].description == "Hello."
+    # Aliases only apply to the extension declaring them.
+    with temporary_visited_package("package", modules, extensions=Extensions(TypingDocExtension())) as package:
+        assert not package["f"].docstring
+
+
+def test_unsupported_alias_target() -> None:
+    """Refuse to alias objects that are not supported."""
+    with pytest.raises(ValueError, match="unsupported"):
+        TypingDocExtension(aliases={"mylib.Doc": "mylib.Documentation"})
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ('"Hello."', "Hello."),
+        ('"It\'s."', "It's."),
+        ("'Say \"hi\".'", 'Say "hi".'),
+        ('"It\'s \\"hi\\"."', 'It\'s "hi".'),
+        ('"Newline\\nand\\\\backslash."', "Newline\nand\\backslash."),
+        ('"Café ☕."', "Café ☕."),
+        ('"Implicit " "concatenation."', "Implicit concatenation."),
+        ('"""\n    Multi.\n\n    Line.\n    """', "Multi.\n\nLine."),
+    ],
+)
+def test_doc_string_values(source: str, expected: str) -> None:
+    """Decode documentation strings exactly as Python does."""
+    with temporary_visited_package(
+        "package",
+        modules={"__init__.py": f"{typing_imports}\na: Annotated[str, Doc({source})]"},
+        extensions=Extensions(TypingDocExtension()),
+    ) as package:
+        assert package["a"].docstring.value == expected
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    """Restore sections of unchanged modules from the disk cache."""
+    modules = {
+        "__init__.py": f"""
+            {typing_imports}
+            from package.errors import Error
+
+            class Options(TypedDict):
+                foo: Annotated[int, Doc("Foo.")]
+
+            def f(a: Annotated[str, Doc("Hello.")] = "a", **kwargs: Unpack[Options]) -> Annotated[
+                int,
+                Doc("Returned."),
+                Raises(Error, "When failing."),
+            ]:
+                '''Docstring.'''
+        """,
+        "errors.py": "class Error(Exception): ...",
+    }
+
+    def _sections(extension: TypingDocExtension) -> list[tuple]:
+        loader = GriffeLoader(extensions=Extensions(extension), search_paths=[tmp_package.tmpdir])
+        package = loader.load("package")
+        return [
+            (
+                section.kind,
+                [
+                    (
+                        getattr(item, "name", None),
+                        item.description,
+                        str(item.annotation),
+                        getattr(item.annotation, "canonical_path", None),
+                        getattr(item, "value", None),
+                    )
+                    for item in section.value
+                ],
+            )
+            for section in package["f"].docstring.parsed[1:]
+        ]
+
+    with temporary_pypackage("package", modules) as tmp_package:
+        first = TypingDocExtension(cache_dir=tmp_path)
+        expected = _sections(first)
+        assert first.cache_stats["disk"]["writes"] == 2
+        second = TypingDocExtension(cache_dir=tmp_path)
+        assert _sections(second) == expected
+        assert second.cache_stats["disk"] == {"hits": 2, "misses": 0, "writes": 0}
+        raises = dict(expected)[DocstringSectionKind.raises]
+        assert raises[0][3] == "package.errors.Error"
+
+
+def test_disk_cache_checks_dependencies(tmp_path: Path) -> None:
+    """Extract sections again when modules they depend on changed."""
+    modules = {
+        "__init__.py": f"""
+            {typing_imports}
+            from package.api import UserId
+            from package.opts import Options
+
+            def f(user: UserId, **kwargs: Unpack[Options]):
+                '''Docstring.'''
+        """,
+        "opts.py": f"{typing_imports}\nclass Options(TypedDict):\n    foo: Annotated[int, Doc('Foo.')]",
+        "types.py": f"{typing_imports}\nUserId = Annotated[int, Doc('User.')]",
+        "api.py": "from package.types import UserId",
+    }
+
+    def _descriptions() -> list[str]:
+        extension = TypingDocExtension(cache_dir=tmp_path)
+        loader = GriffeLoader(extensions=Extensions(extension), search_paths=[tmp_package.tmpdir])
+        package = loader.load("package")
+        return [item.description for section in package["f"].docstring.parsed[1:] for item in section.value]
+
+    with temporary_pypackage("package", modules) as tmp_package:
+        assert _descriptions() == ["User.", "Foo."]
+        assert _descriptions() == ["User.", "Foo."]
+        tmp_package.path.joinpath("opts.py").write_text(
+            f"{typing_imports}\nclass Options(TypedDict):\n    foo: Annotated[int, Doc('Bar.')]",
+        )
+        assert _descriptions() == ["User.", "Bar."]
+        tmp_package.path.joinpath("types.py").write_text(f"{typing_imports}\nUserId = Annotated[int, Doc('Id.')]")
+        assert _descriptions() == ["Id.", "Bar."]
+
+
+def test_invalidate_and_refresh_changed_module() -> None:
+    """Process changed modules again when they are loaded again or refreshed."""
+    extension = TypingDocExtension()
+
+    def _load(search_path: str) -> GriffeLoader:
+        loader = GriffeLoader(extensions=Extensions(extension), search_paths=[search_path])
+        loader.load("package")
+        return loader
+
+    def _description(loader: GriffeLoader) -> str | None:
+        sections = loader.modules_collection["package.f"].docstring.parsed
+        return sections[1].value[0].description if len(sections) > 1 else None
+
+    with temporary_pypackage(
+        "package",
+        {"__init__.py": f"{typing_imports}\ndef f(a: Annotated[str, Doc('Hello.')]):\n    '''Docstring.'''"},
+    ) as tmp_package:
+        assert _description(_load(tmp_package.tmpdir)) == "Hello."
+
+        tmp_package.path.joinpath("__init__.py").write_text(
+            f"{typing_imports}\ndef f(a: Annotated[str, Doc('World.')]):\n    '''Docstring.'''",
+        )
+        assert _description(_load(tmp_package.tmpdir)) == "World."
+
+        loader = GriffeLoader(search_paths=[tmp_package.tmpdir])
+        loader.load("package")
+        extension.refresh(loader.modules_collection["package.f"])
+        assert _description(loader) == "World."
+
+        function = loader.modules_collection["package.f"]
+        function.docstring = Docstring("Docstring.", parent=function)
+        extension.on_package(pkg=loader.modules_collection["package"])
+        assert _description(loader) is None
+        extension.invalidate("package")
+        extension.on_package(pkg=loader.modules_collection["package"])
+        assert _description(loader) == "World."
+
+
+def test_handled_objects_are_released() -> None:
+    """Do not keep track of objects that are not referenced anymore, or once reset."""
+    extension = TypingDocExtension()
+    with temporary_visited_package(
+        "package",
+        modules={"__init__.py": f"{typing_imports}\ndef f(a: Annotated[str, Doc('Hello.')]): ..."},
+        extensions=Extensions(extension),
+    ) as package:
+        assert len(extension._handled) == 1
+        extension.reset()
+        assert len(extension._handled) == 0
+        extension.on_package(pkg=package)
+        assert len(extension._handled) == 1
+        del package
+    gc.collect()
+    assert len(extension._handled) == 0
+
+
+def test_parallel_extraction_is_deterministic() -> None:
+    """Extract sections with several threads, merging them in a deterministic order."""
+    modules = {
+        f"module{index}.py": f"""
+            {typing_imports}
+            class A:
+                a: Annotated[int, Doc("Attribute {index}.")]
+                def f(self, b: Annotated[str, Doc("Parameter {index}.")]) -> Annotated[int, Doc("Return {index}.")]:
+                    '''Docstring.'''
+            def g(c: Annotated[str, Doc("Parameter {index}.")]):
+                '''Docstring.'''
+        """
+        for index in range(8)
+    }
+
+    def _descriptions(workers: int) -> list[tuple[str, list]]:
+        with temporary_visited_package(
+            "package",
+            modules,
+            extensions=Extensions(TypingDocExtension(workers=workers)),
+        ) as package:
+            return [
+                (
+                    path,
+                    [
+                        (section.kind, [item.description for item in section.value])
+                        if isinstance(section.value, list)
+                        else (section.kind, section.value)
+                        for section in package[path].docstring.parsed
+                    ],
+                )
+                for index in range(8)
+                for path in (f"module{index}.A.a", f"module{index}.A.f", f"module{index}.g")
+            ]
+
+    assert _descriptions(workers=4) == _descriptions(workers=1)
+
+
+def test_profile_phases(tmp_path: Path) -> None:
+    """Record the time spent in each phase, and dump it as JSON."""
+    output = tmp_path / "profile.json"
+    extension = TypingDocExtension(profile_output=output)
+    with temporary_visited_package(
+        "package",
+        {"__init__.py": f"{typing_imports}\ndef f(a: Annotated[str, Doc('Hello.')]) -> Iterator[int]: ..."},
+        extensions=Extensions(extension),
+    ):
+        pass
+    stats = extension.profile_stats
+    for phase in ("metadata", "docstring_parsing", "merge", "sections.parameters", "sections.yields"):
+        assert stats[phase]["calls"] >= 1
+        assert stats[phase]["seconds"] >= 0
+    assert json.loads(output.read_text()) == stats
+    # Profiling belongs to each extension: other extensions neither disable nor feed it.
+    assert not TypingDocExtension().profile_stats
+    assert extension.profile_stats == stats
+
+
+def test_profile_modules_of_objects_processed_in_hooks() -> None:
+    """Time objects processed as soon as they are loaded along with the other objects of their module."""
+    code = "from typing_extensions import Annotated, Doc\ndef f(a: Annotated[str, Doc('Hello.')]): ..."
+    inspecting = TypingDocExtension(profile=True)
+    with temporary_inspected_package("package", {"__init__.py": code}, extensions=Extensions(inspecting)):
+        pass
+    visiting = TypingDocExtension(profile=True, on_visit=True)
+    with temporary_visited_package("package", {"__init__.py": code}, extensions=Extensions(visiting)):
+        pass
+    for extension in (inspecting, visiting):
+        stats = extension.profile_stats
+        assert stats["modules.package"]["seconds"] >= stats["sections.parameters"]["seconds"] > 0
+
+
+def test_typed_dict_inheritance_and_reuse() -> None:
+    """Document inherited typed dict keys, resolve each typed dict once, and build a section per function."""
+    extension = TypingDocExtension()
+    before = extension.cache_stats["typed_dicts"]
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                from package.base import BaseOptions
+
+                class Options(BaseOptions, total=False):
+                    bar: Annotated[str, Doc("Bar.")]
+
+                def f(**kwargs: Unpack[Options]): ...
+                def g(**kwargs: Unpack[Options]): ...
+            """,
+            "base.py": f"""
+                {typing_imports}
+                class BaseOptions(TypedDict, total=False):
+                    foo: Annotated[int, Doc("Foo.")]
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        for function in ("f", "g"):
+            section = package[function].docstring.parsed[1]
+            assert section.kind is DocstringSectionKind.other_parameters
+            assert [(param.name, param.description) for param in section.value] == [("foo", "Foo."), ("bar", "Bar.")]
+        # Sections are not shared, so that they can be modified in place.
+        first, second = package["f"].docstring.parsed[1], package["g"].docstring.parsed[1]
+        assert first is not second
+        assert first.value[0] is not second.value[0]
+    after = extension.cache_stats["typed_dicts"]
+    assert after["hits"] - before["hits"] >= 1  # type: ignore[operator]
+
+
+def test_lazy_sections() -> None:
+    """Add sections to docstrings only once they are parsed."""
+    with temporary_visited_package(
+        "package",
+        modules={
+            "__init__.py": f"""
+                {typing_imports}
+                a: Annotated[str, Doc("Hello.")]
+
+                def f(b: Annotated[str, Doc("World.")]) -> Annotated[int, Doc("Answer.")]:
+                    \"\"\"Summary.\"\"\"
+            """,
+        },
+        extensions=Extensions(TypingDocExtension(lazy=True)),
+    ) as package:
+        assert package["a"].docstring.value == "Hello."
+        assert "parsed" not in package["f"].docstring.__dict__
+        assert package["f"].docstring.value == "Summary."
+        parsed = package["f"].docstring.parsed
+        assert [section.kind for section in parsed] == [
+            DocstringSectionKind.text,
+            DocstringSectionKind.parameters,
+            DocstringSectionKind.returns,
+        ]
+        assert parsed[1].value[0].description == "World."
+        assert package["f"].docstring.parsed is parsed
+
+
+def test_dynamic_sections() -> None:
+    """Read every kind of section from runtime annotations."""
+    extension = TypingDocExtension(
+        aliases={"package.Raises": "typing.Raises", "package.Warns": "typing.Warns", "package.Broken": "typing.Raises"},
+    )
+    with temporary_inspected_package(
+        "package",
+        {
+            "__init__.py": """
+                from typing import Generator
+                from typing_extensions import Annotated, Doc, deprecated
+
+                class Raises:
+                    def __init__(self, exception, documentation):
+                        self.exception = exception
+                        self.documentation = documentation
+
+                class Warns:
+                    def __init__(self, warning, documentation):
+                        self.warning = warning
+                        self.documentation = documentation
+
+                class Broken:
+                    '''Does not store its arguments.'''
+
+                def f(
+                    a: Annotated[int, Doc("A.")],
+                    b: int = 0,
+                ) -> Annotated[
+                    int,
+                    Doc("Answer."),
+                    deprecated("Deprecated."),
+                    Raises(ValueError, "Bad value."),
+                    Warns(UserWarning, "Careful."),
+                    Broken(),
+                ]:
+                    '''Summary.'''
+
+                def g() -> Generator[
+                    tuple[Annotated[int, Doc("First.")], Annotated[str, Doc("Second.")]],
+                    Annotated[bool, Doc("Received.")],
+                    Annotated[None, Doc("Returned.")],
+                ]:
+                    '''Summary.'''
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        sections = {section.kind: section for section in package["f"].docstring.parsed}
+        assert sections[DocstringSectionKind.admonition].title == "Deprecated."
+        assert [(param.name, param.description) for param in sections[DocstringSectionKind.parameters].value] == [
+            ("a", "A."),
+        ]
+        assert [(item.annotation, item.description) for item in sections[DocstringSectionKind.raises].value] == [
+            ("ValueError", "Bad value."),
+        ]
+        assert [(item.annotation, item.description) for item in sections[DocstringSectionKind.warns].value] == [
+            ("UserWarning", "Careful."),
+        ]
+        assert [(item.annotation, item.description) for item in sections[DocstringSectionKind.returns].value] == [
+            ("int", "Answer."),
+        ]
+
+        sections = {section.kind: section for section in package["g"].docstring.parsed}
+        assert [item.description for item in sections[DocstringSectionKind.yields].value] == ["First.", "Second."]
+        assert [item.description for item in sections[DocstringSectionKind.receives].value] == ["Received."]
+        assert [item.description for item in sections[DocstringSectionKind.returns].value] == ["Returned."]
+
+
+def test_dynamic_unpacking_typed_dict() -> None:
+    """Read documentation of unpacked typed dicts at runtime, once per typed dict."""
+    extension = TypingDocExtension()
+    before = extension.cache_stats["runtime_typed_dicts"]
+    with temporary_inspected_package(
+        "package",
+        {
+            "__init__.py": """
+                from typing_extensions import Annotated, Doc, NotRequired, TypedDict, Unpack
+
+                class BaseOptions(TypedDict):
+                    foo: Annotated[int, Doc("Foo.")]
+
+                class Options(BaseOptions):
+                    bar: NotRequired[Annotated[str, Doc("Bar.")]]
+                    baz: int
+
+                def f(**kwargs: Unpack[Options]) -> None:
+                    '''Summary.'''
+
+                def g(**kwargs: Unpack[Options]) -> None:
+                    '''Summary.'''
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        for function in ("f", "g"):
+            section = package[function].docstring.parsed[1]
+            assert section.kind is DocstringSectionKind.other_parameters
+            assert [(param.name, param.description) for param in section.value] == [("foo", "Foo."), ("bar", "Bar.")]
+        # Sections are not shared, so that they can be modified in place.
+        first, second = package["f"].docstring.parsed[1], package["g"].docstring.parsed[1]
+        assert first is not second
+        assert first.value[0] is not second.value[0]
+    after = extension.cache_stats["runtime_typed_dicts"]
+    assert after["hits"] - before["hits"] >= 1  # type: ignore[operator]
+
+
+def test_traversal_order() -> None:
+    """Stream objects module by module, each module's own objects before its submodules."""
+    extension = TypingDocExtension()
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": "a = 0\nclass A:\n    b = 0\n    class B:\n        def c(self): ...\n    d = 0\ne = 0",
+            "sub1/__init__.py": "f = 0",
+            "sub1/deep.py": "g = 0",
+        },
+    ) as package:
+        batches = [
+            (module and module.path, [obj.path for obj in objects]) for module, objects in extension._batches(package)
+        ]
+    assert batches == [
+        ("package", ["package.a", "package.A.b", "package.A.B.c", "package.A.d", "package.e"]),
+        ("package.sub1", ["package.sub1.f"]),
+        ("package.sub1.deep", ["package.sub1.deep.g"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("options", "documented"),
+    [
+        ({}, {"f", "a", "A.m", "sub.g", "_private.h"}),
+        ({"exclude": ["*._*"]}, {"f", "a", "A.m", "sub.g"}),
+        ({"exclude": ["package.A", "package.sub"]}, {"f", "a", "_private.h"}),
+        ({"include": ["package.sub.*", "*.m"]}, {"A.m", "sub.g"}),
+        ({"kinds": ["attribute"]}, {"a"}),
+    ],
+)
+def test_filters(options: dict, documented: set[str]) -> None:
+    """Only process selected objects."""
+    function = "(x: Annotated[int, Doc('X.')]): ..."
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"{typing_imports}\ndef f{function}\na: Annotated[int, Doc('A.')]\nclass A:\n    def m{function}",
+            "sub.py": f"{typing_imports}\ndef g{function}",
+            "_private.py": f"{typing_imports}\ndef h{function}",
+        },
+        extensions=Extensions(TypingDocExtension(**options)),
+    ) as package:
+        paths = ["f", "a", "A.m", "sub.g", "_private.h"]
+        assert {path for path in paths if package[path].docstring} == documented
+
+
+def test_unsupported_filtered_kinds() -> None:
+    """Reject unknown kinds of objects."""
+    with pytest.raises(ValueError, match="unsupported kinds"):
+        TypingDocExtension(kinds=["class"])
+
+
+def test_skip_objects_without_annotated_metadata() -> None:
+    """Do not build sections for objects that cannot have any."""
+    extension = TypingDocExtension(profile=True)
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                def f(a: int, b: list[str]) -> dict[str, int]: ...
+                def g(a: Annotated[int, Doc("A.")]): ...
+                def h(): ...
+                c: list[int] = []
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        assert package["g"].docstring
+        assert not package["f"].docstring
+    assert extension.profile_stats["sections.parameters"]["calls"] == 1
+
+
+def test_on_visit_matches_package_processing() -> None:
+    """Produce the same sections while visiting objects as once the package is loaded."""
+    modules = {
+        "__init__.py": f"""
+            {typing_imports}
+            import typing
+            from typing import overload
+
+            import typing_extensions as te
+            from typing_extensions import deprecated
+            from package.options import Options
+            from package.types import UserId
+
+            class A:
+                a: Annotated[int, Doc("A."), deprecated("Deprecated.")]
+
+                def __init__(self) -> None:
+                    '''Init.'''
+                    self.a = 0
+
+            @overload
+            def f(x: Annotated[int, Doc("Overload.")]) -> int: ...
+            def f(x: Annotated[int, Doc("X.")]) -> Annotated[int, Doc("Answer.")]:
+                '''Summary.'''
+
+            def g(**kwargs: Unpack[Options]) -> None:
+                '''Summary.'''
+
+            def h(a: UserId, b: Label) -> None:
+                '''Summary.'''
+
+            def k(a: te.Annotated[int, te.Doc("Qualified.")]) -> typing.Annotated[int, typing.Doc("Answer.")]:
+                '''Summary.'''
+
+            b: Label
+
+            Label = Annotated[str, Doc("The label.")]
+        """,
+        "options.py": f"""
+            {typing_imports}
+            class Options(TypedDict):
+                foo: Annotated[int, Doc("Foo.")]
+        """,
+        "types.py": f"""
+            {typing_imports}
+            UserId = Annotated[int, Doc("The user id.")]
+        """,
+    }
+    paths = ["A.a", "A.__init__", "f", "g", "h", "k", "b"]
+
+    class _Recorder(Extension):
+        def __init__(self) -> None:
+            self.visited: list[str] = []
+
+        def on_function_instance(self, *, func: Function, **kwargs: Any) -> None:  # noqa: ARG002
+            if func.docstring and len(func.docstring.parsed) > 1:
+                self.visited.append(func.path)
+
+    def _sections(*, on_visit: bool, recorder: _Recorder | None = None) -> list[str]:
+        extensions = Extensions(TypingDocExtension(on_visit=on_visit), *([recorder] if recorder else []))
+        with temporary_visited_package("package", modules, extensions=extensions) as package:
+            return [json.dumps(package[path].docstring.parsed, cls=JSONEncoder) for path in paths]
+
+    recorder = _Recorder()
+    sections = _sections(on_visit=True, recorder=recorder)
+    assert sections == _sections(on_visit=False)
+    assert "The user id." in sections[4]
+    assert "The label." in sections[4]
+    assert "The label." in sections[6]
+    assert "Qualified." in sections[5]
+    # Objects using names that are not known yet are processed once the package is loaded,
+    # while names qualified with a module are known as soon as they are visited.
+    assert recorder.visited == ["package.f", "package.k"]
+
+
+def test_annotated_aliases() -> None:
+    """Read documentation from aliases of annotated types, resolving each alias once."""
+    extension = TypingDocExtension()
+    before = extension.cache_stats["aliases"]
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                from package import types
+                from package.types import UserId
+
+                def f(a: UserId, b: types.Name, c: int) -> UserId: ...
+                def g(a: UserId) -> None: ...
+            """,
+            "types.py": f"""
+                {typing_imports}
+                UserId = Annotated[int, Doc("The user id.")]
+                Name = Annotated[str, Doc("The name.")]
+            """,
+        },
+        extensions=Extensions(extension),
+    ) as package:
+        sections = package["f"].docstring.parsed
+        assert [(param.name, param.description) for param in sections[1].value] == [
+            ("a", "The user id."),
+            ("b", "The name."),
+        ]
+        assert sections[2].kind is DocstringSectionKind.returns
+        assert sections[2].value[0].description == "The user id."
+        assert package["g"].docstring.parsed[1].value[0].description == "The user id."
+    after = extension.cache_stats["aliases"]
+    assert after["hits"] - before["hits"] >= 2  # type: ignore[operator]
+
+
+def test_cache_missing_external_aliases() -> None:
+    """Look up names of packages that are not loaded only once."""
+    extension = TypingDocExtension()
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": """
+                from pathlib import Path
+
+                def f(a: Path) -> Path: ...
+                def g(a: Path) -> Path: ...
+            """,
+        },
+        extensions=Extensions(extension),
+    ):
+        pass
+    stats = extension.cache_stats["aliases"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+
+
+def test_parameter_defaults(tmp_path: Path) -> None:
+    """Record default values of documented parameters, also when restored from the disk cache."""
+    modules = {
+        "__init__.py": f"""
+            {typing_imports}
+            def f(
+                a: Annotated[int, Doc("A.")],
+                b: Annotated[int, Doc("B.")] = 1,
+                *args: Annotated[int, Doc("Args.")],
+                c: Annotated[str, Doc("C.")] = "c",
+                **kwargs: Annotated[int, Doc("Kwargs.")],
+            ): ...
+        """,
+    }
+    with temporary_pypackage("package", modules) as tmp_package:
+        for _ in range(2):
+            extension = TypingDocExtension(cache_dir=tmp_path / "cache")
+            loader = GriffeLoader(extensions=Extensions(extension), search_paths=[tmp_package.tmpdir])
+            function = loader.load("package")["f"]
+            assert [(param.name, param.value) for param in function.docstring.parsed[1].value] == [
+                ("a", None),
+                ("b", "1"),
+                ("*args", "()"),
+                ("c", "'c'"),
+                ("**kwargs", "{}"),
+            ]
+    assert extension.cache_stats["disk"]["hits"] == 1
+
+
+def test_index_output(tmp_path: Path) -> None:
+    """Write extracted sections to a standalone index."""
+    output = tmp_path / "index.json"
+    with temporary_visited_package(
+        "package",
+        {
+            "__init__.py": f"""
+                {typing_imports}
+                from typing_extensions import deprecated
+
+                a: Annotated[int, Doc("A.")]
+
+                def f(x: Annotated[int, Doc("X.")] = 0) -> Annotated[
+                    int,
+                    Doc("Answer."),
+                    deprecated("Deprecated."),
+                    Raises(ValueError, "Bad value."),
+                ]:
+                    '''Summary.'''
+
+                def g(): ...
+            """,
+        },
+        extensions=Extensions(TypingDocExtension(index_output=output)),
+    ):
+        pass
+    index = TypingDocIndex.load(output)
+    assert index.paths == ["package.a", "package.f"]
+    assert "package.g" not in index
+    assert index.get("package.g") is None
+    assert index["package.a"] == {"docstring": "A."}
+    assert index["package.f"] == {
+        "deprecated": "Deprecated.",
+        "parameters": [["x", "int", "X."]],
+        "raises": [["ValueError", "Bad value."]],
+        "returns": [["", "int", "Answer."]],
+    }
+
+
+def test_index_reader_does_not_import_griffe() -> None:
+    """Read indexes without importing Griffe."""
+    code = "import sys; from griffe_typingdoc import TypingDocIndex; assert 'griffe' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603